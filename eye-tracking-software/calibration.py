@@ -11,22 +11,86 @@ from AppKit import (
     NSWindow, NSScreen, NSView, NSColor, NSFont,
     NSWindowStyleMaskBorderless, NSBackingStoreBuffered,
     NSApplication, NSButton,
-    NSBezelStyleRounded, NSTextField, NSImageView, NSImage,
-    NSBitmapImageRep, NSCompositingOperationSourceOver,
+    NSBezelStyleRounded, NSTextField, NSImageView,
 )
 
+from display_link import DisplayLink
+from gaze_estimator import FEATURE_DIM
+
+# AppKit names used while drawing, resolved once instead of per frame
+_NSFontAttr = AppKit.NSFontAttributeName
+_NSFgAttr = AppKit.NSForegroundColorAttributeName
+_NSAttrStr = AppKit.NSAttributedString
+_NSIntersectsRect = AppKit.NSIntersectsRect
+
+# Webcam thumbnail shown in the bottom-right corner of the calibration screen
+THUMB_WIDTH = 160
+THUMB_HEIGHT = 120
+THUMB_MIN_INTERVAL = 0.033  # never re-upload the thumbnail faster than ~30fps
+
+# Most frames a 1.5s collection window can produce (60fps camera)
+MAX_COLLECT_FRAMES = 90
+
+# Height of the strip at the bottom of the screen holding the progress text
+TEXT_BAND_HEIGHT = 100
+
+# Phase durations (seconds)
+ANIMATE_DURATION = 0.3     # target scale-in
+SETTLE_DURATION = 0.5      # let the user's eyes settle on the target
+COLLECT_DURATION = 1.5     # sample features
+TRANSITION_DURATION = 0.15 # pause between points
+
+ANIMATE_INTERVAL = 1.0 / 60.0
+COLLECT_INTERVAL = 1.0 / 30.0
+
+# Cubic ease-out scale for each 60fps frame of the scale-in animation
+ANIMATE_FRAMES = round(ANIMATE_DURATION * 60)
+_EASE_LUT = tuple(
+    1.0 - (1.0 - i / (ANIMATE_FRAMES - 1)) ** 3 for i in range(ANIMATE_FRAMES)
+)
+
+INSTRUCTION_LINES = [
+    "Calibration",
+    "",
+    "Keep your head still throughout calibration",
+    "Look at each dot as it appears",
+    "Try to keep your face centred in the camera",
+    "",
+    "Press any key or click to begin...    (Esc to cancel)",
+]
+
+
+def _text_attrs(font, color):
+    """Attribute dict for drawing text with the given font and colour."""
+    return {
+        _NSFontAttr: font,
+        _NSFgAttr: color,
+    }
+
+
+def _circle_path(r):
+    """Immutable circle CGPath of radius r centred on the layer origin."""
+    return Quartz.CGPathCreateWithEllipseInRect(((-r, -r), (r * 2, r * 2)), None)
+
+
+# Target dot radius at full scale
+TARGET_RADIUS = 12
+
+
+def _attributed_string(text, attrs):
+    return _NSAttrStr.alloc().initWithString_attributes_(text, attrs)
+
 
 def generate_calibration_points(screen_width, screen_height, cols=5, rows=4):
-    """Generate calibration points in a grid covering the screen with margins."""
+    """Generate calibration points in a grid covering the screen with margins.
+
+    Returns a float32 array of shape (rows * cols, 2), row by row.
+    """
     margin_x = screen_width * 0.05
     margin_y = screen_height * 0.05
-    points = []
-    for row in range(rows):
-        for col in range(cols):
-            x = margin_x + col * (screen_width - 2 * margin_x) / (cols - 1)
-            y = margin_y + row * (screen_height - 2 * margin_y) / (rows - 1)
-            points.append((x, y))
-    return points
+    xs = margin_x + np.linspace(0, 1, cols) * (screen_width - 2 * margin_x)
+    ys = margin_y + np.linspace(0, 1, rows) * (screen_height - 2 * margin_y)
+    return np.stack(np.meshgrid(xs, ys), axis=-1).reshape(-1, 2).astype(np.float32)
 
 
 class CalibrationView(NSView):
@@ -47,189 +111,254 @@ class CalibrationView(NSView):
         self._mean_error = 0.0
         self._mean_error_pct = 0.0
         self._show_warning = False
-        self._webcam_image = None
         self._show_accept_redo = False
+        self._result_layers = []
+        self.setWantsLayer_(True)
+        self._setup_layers()
+        self._setup_text()
         return self
 
-    def drawRect_(self, rect):
-        NSColor.blackColor().setFill()
-        AppKit.NSRectFill(rect)
+    @objc.python_method
+    def _setup_text(self):
+        """Build fonts, text attributes and the static strings once."""
+        white = NSColor.whiteColor()
+        body_attrs = _text_attrs(NSFont.systemFontOfSize_(24), white)
+        title_attrs = _text_attrs(NSFont.boldSystemFontOfSize_(36), white)
+        self._instruction_strings = [
+            _attributed_string(line, title_attrs if i == 0 else body_attrs)
+            for i, line in enumerate(INSTRUCTION_LINES)
+        ]
+
+        self._progress_attrs = _text_attrs(
+            NSFont.systemFontOfSize_(18), NSColor.colorWithCalibratedWhite_alpha_(0.7, 1.0)
+        )
+        self._hint_attrs = _text_attrs(
+            NSFont.systemFontOfSize_(14), NSColor.colorWithCalibratedWhite_alpha_(0.5, 1.0)
+        )
+        self._stats_attrs = _text_attrs(NSFont.systemFontOfSize_(18), white)
+
+        self._results_title = _attributed_string(
+            "Calibration Results", _text_attrs(NSFont.boldSystemFontOfSize_(28), white)
+        )
+        self._warning_string = _attributed_string(
+            "Warning: High calibration error. Consider recalibrating.",
+            _text_attrs(NSFont.boldSystemFontOfSize_(16), NSColor.yellowColor()),
+        )
+        self._legend_string = _attributed_string(
+            "Green = target    Red = predicted gaze    Click 'Accept' or 'Redo'",
+            _text_attrs(NSFont.systemFontOfSize_(14), NSColor.colorWithCalibratedWhite_alpha_(0.6, 1.0)),
+        )
+        # Dynamic strings (progress, stats) keyed by (text, attrs)
+        self._string_cache = {}
+
+    @objc.python_method
+    def _cached_string(self, text, attrs):
+        """Return an attributed string for text, building it only once."""
+        key = (text, id(attrs))
+        string = self._string_cache.get(key)
+        if string is None:
+            string = _attributed_string(text, attrs)
+            self._string_cache[key] = string
+        return string
+
+    @objc.python_method
+    def _setup_layers(self):
+        """Create the Core Animation layers for the background and target dot."""
+        root = self.layer()
+        root.setBackgroundColor_(NSColor.blackColor().CGColor())
+
+        self._glow_layer = Quartz.CAShapeLayer.layer()
+        self._glow_layer.setFillColor_(
+            NSColor.colorWithCalibratedRed_green_blue_alpha_(0.3, 0.6, 1.0, 0.3).CGColor()
+        )
+        self._dot_layer = Quartz.CAShapeLayer.layer()
+        self._dot_layer.setFillColor_(
+            NSColor.colorWithCalibratedRed_green_blue_alpha_(0.4, 0.7, 1.0, 1.0).CGColor()
+        )
+        self._center_layer = Quartz.CAShapeLayer.layer()
+        self._center_layer.setFillColor_(NSColor.whiteColor().CGColor())
+
+        # Paths are built once at full size; the animation only moves and
+        # scales the layers, so no path is rebuilt per frame
+        self._target_layers = (self._glow_layer, self._dot_layer, self._center_layer)
+        for layer, r in zip(self._target_layers,
+                            (TARGET_RADIUS * 2, TARGET_RADIUS, TARGET_RADIUS * 0.4)):
+            layer.setPath_(_circle_path(r))
+            layer.setHidden_(True)
+            root.addSublayer_(layer)
+
+        # Webcam thumbnail, anchored bottom-right
+        sw = self.bounds().size.width
+        self._webcam_layer = Quartz.CALayer.layer()
+        self._webcam_layer.setFrame_(((sw - 180, 10), (THUMB_WIDTH, THUMB_HEIGHT)))
+        self._webcam_layer.setHidden_(True)
+        root.addSublayer_(self._webcam_layer)
+
+    def viewDidChangeBackingProperties(self):
+        objc.super(CalibrationView, self).viewDidChangeBackingProperties()
+        window = self.window()
+        if window is None:
+            return
+        scale = window.backingScaleFactor()
+        self.layer().setContentsScale_(scale)
+        for layer in self._target_layers + tuple(self._result_layers):
+            layer.setContentsScale_(scale)
+        self._webcam_layer.setContentsScale_(scale)
+
+    @objc.python_method
+    def _set_webcam_image(self, cg_image):
+        """Show a new webcam thumbnail (a CGImage) in the preview layer."""
+        Quartz.CATransaction.begin()
+        Quartz.CATransaction.setDisableActions_(True)
+        self._webcam_layer.setContents_(cg_image)
+        self._webcam_layer.setOpacity_(0.8 if self._phase == "instructions" else 0.7)
+        self._webcam_layer.setHidden_(self._phase == "results")
+        Quartz.CATransaction.commit()
+
+    @objc.python_method
+    def _update_target_layers(self):
+        """Sync the target dot layers with the current target position and scale."""
+        visible = (self._phase == "calibrating" and self._target_visible
+                   and self._target_scale > 0)
+
+        Quartz.CATransaction.begin()
+        Quartz.CATransaction.setDisableActions_(True)
+        for layer in self._target_layers:
+            layer.setHidden_(not visible)
+        if visible:
+            # Flip Y for AppKit coordinate system (origin bottom-left)
+            position = (self._target_x, self.bounds().size.height - self._target_y)
+            scale = self._target_scale
+            transform = Quartz.CATransform3DMakeScale(scale, scale, 1.0)
+            for layer in self._target_layers:
+                layer.setPosition_(position)
+                layer.setTransform_(transform)
+            self._glow_layer.setOpacity_(self._target_scale)
+            self._dot_layer.setOpacity_(self._target_scale)
+        Quartz.CATransaction.commit()
+
+    @objc.python_method
+    def _build_result_layers(self):
+        """Build the static result markers as three layers.
+
+        All connectors share one stroked path and all target / predicted dots
+        share one filled path per colour, so the whole results plot is three
+        draw submissions however many points were collected.
+        """
+        for layer in self._result_layers:
+            layer.removeFromSuperlayer()
+        self._result_layers = []
+
+        sh = self.bounds().size.height
+        r = 6
+        lines = Quartz.CGPathCreateMutable()
+        targets = Quartz.CGPathCreateMutable()
+        predictions = Quartz.CGPathCreateMutable()
+        for (tx, ty, px, py, err) in self._result_points:
+            # Flip Y
+            ty_f = sh - ty
+            py_f = sh - py
+            Quartz.CGPathMoveToPoint(lines, None, tx, ty_f)
+            Quartz.CGPathAddLineToPoint(lines, None, px, py_f)
+            Quartz.CGPathAddEllipseInRect(targets, None, ((tx - r, ty_f - r), (r * 2, r * 2)))
+            Quartz.CGPathAddEllipseInRect(predictions, None, ((px - r, py_f - r), (r * 2, r * 2)))
+
+        # Connectors (grey), target points (green), predicted gaze (red)
+        line_layer = Quartz.CAShapeLayer.layer()
+        line_layer.setPath_(lines)
+        line_layer.setStrokeColor_(NSColor.colorWithCalibratedWhite_alpha_(0.4, 1.0).CGColor())
+        line_layer.setFillColor_(None)
+        line_layer.setLineWidth_(1.0)
+
+        target_layer = Quartz.CAShapeLayer.layer()
+        target_layer.setPath_(targets)
+        target_layer.setFillColor_(NSColor.greenColor().CGColor())
+
+        predicted_layer = Quartz.CAShapeLayer.layer()
+        predicted_layer.setPath_(predictions)
+        predicted_layer.setFillColor_(NSColor.redColor().CGColor())
+
+        Quartz.CATransaction.begin()
+        Quartz.CATransaction.setDisableActions_(True)
+        # The webcam thumbnail is not shown on the results screen
+        self._webcam_layer.setHidden_(True)
+        root = self.layer()
+        for layer in (line_layer, target_layer, predicted_layer):
+            root.addSublayer_(layer)
+            self._result_layers.append(layer)
+        Quartz.CATransaction.commit()
+
+    @objc.python_method
+    def invalidate_text_band(self):
+        """Mark only the bottom strip holding the progress text as dirty."""
+        self.setNeedsDisplayInRect_(
+            ((0, 0), (self.bounds().size.width, TEXT_BAND_HEIGHT))
+        )
 
+    def drawRect_(self, rect):
+        # Background, target dot, result dots and the webcam thumbnail are
+        # Core Animation layers; only text is drawn here, and only the strings
+        # that intersect the dirty rect.
         bounds = self.bounds()
         sw = bounds.size.width
         sh = bounds.size.height
 
         if self._phase == "instructions":
-            self._draw_instructions(sw, sh)
+            self._draw_instructions(sw, sh, rect)
         elif self._phase == "calibrating":
-            self._draw_calibration_target(sw, sh)
+            self._draw_calibration_target(sw, sh, rect)
         elif self._phase == "results":
-            self._draw_results(sw, sh)
+            self._draw_results(sw, sh, rect)
+
+    @objc.python_method
+    def _draw_centered(self, s, y, sw, rect):
+        """Draw s horizontally centred at height y if it intersects rect.
 
-    def _draw_instructions(self, sw, sh):
+        Returns the string size so callers can stack lines.
+        """
+        size = s.size()
+        origin = (sw / 2 - size.width / 2, y)
+        if _NSIntersectsRect((origin, (size.width, size.height)), rect):
+            s.drawAtPoint_(origin)
+        return size
+
+    @objc.python_method
+    def _draw_instructions(self, sw, sh, rect):
         """Draw pre-calibration instruction screen."""
-        attrs = {
-            AppKit.NSFontAttributeName: NSFont.systemFontOfSize_(24),
-            AppKit.NSForegroundColorAttributeName: NSColor.whiteColor(),
-        }
-        lines = [
-            "Calibration",
-            "",
-            "Keep your head still throughout calibration",
-            "Look at each dot as it appears",
-            "Try to keep your face centred in the camera",
-            "",
-            "Press any key or click to begin...    (Esc to cancel)",
-        ]
-        title_attrs = {
-            AppKit.NSFontAttributeName: NSFont.boldSystemFontOfSize_(36),
-            AppKit.NSForegroundColorAttributeName: NSColor.whiteColor(),
-        }
         y = sh * 0.65
-        for i, line in enumerate(lines):
-            a = title_attrs if i == 0 else attrs
-            s = AppKit.NSAttributedString.alloc().initWithString_attributes_(line, a)
-            size = s.size()
-            s.drawAtPoint_((sw / 2 - size.width / 2, y))
+        for s in self._instruction_strings:
+            size = self._draw_centered(s, y, sw, rect)
             y -= size.height + 8
 
-        # Draw webcam preview if available
-        if self._webcam_image is not None:
-            self._webcam_image.drawInRect_fromRect_operation_fraction_(
-                ((sw - 180, 10), (160, 120)),
-                ((0, 0), (self._webcam_image.size().width, self._webcam_image.size().height)),
-                NSCompositingOperationSourceOver,
-                0.8,
-            )
-
-    def _draw_calibration_target(self, sw, sh):
-        """Draw the animated target dot and progress text."""
-        if self._target_visible and self._target_scale > 0:
-            radius = 12 * self._target_scale
-            x = self._target_x - radius
-            # Flip Y for AppKit coordinate system (origin bottom-left)
-            y = (sh - self._target_y) - radius
-            oval_rect = ((x, y), (radius * 2, radius * 2))
-
-            # Outer glow
-            glow_color = NSColor.colorWithCalibratedRed_green_blue_alpha_(0.3, 0.6, 1.0, 0.3 * self._target_scale)
-            glow_color.setFill()
-            glow_radius = radius * 2
-            glow_rect = ((self._target_x - glow_radius, (sh - self._target_y) - glow_radius),
-                         (glow_radius * 2, glow_radius * 2))
-            path = AppKit.NSBezierPath.bezierPathWithOvalInRect_(glow_rect)
-            path.fill()
-
-            # Main dot
-            dot_color = NSColor.colorWithCalibratedRed_green_blue_alpha_(0.4, 0.7, 1.0, self._target_scale)
-            dot_color.setFill()
-            path = AppKit.NSBezierPath.bezierPathWithOvalInRect_(oval_rect)
-            path.fill()
-
-            # Centre bright spot
-            center_radius = radius * 0.4
-            center_rect = ((self._target_x - center_radius, (sh - self._target_y) - center_radius),
-                           (center_radius * 2, center_radius * 2))
-            NSColor.whiteColor().setFill()
-            path = AppKit.NSBezierPath.bezierPathWithOvalInRect_(center_rect)
-            path.fill()
-
+    @objc.python_method
+    def _draw_calibration_target(self, sw, sh, rect):
+        """Draw the progress text; the target dot itself is a layer."""
         # Progress text
         if self._progress_text:
-            attrs = {
-                AppKit.NSFontAttributeName: NSFont.systemFontOfSize_(18),
-                AppKit.NSForegroundColorAttributeName: NSColor.colorWithCalibratedWhite_alpha_(0.7, 1.0),
-            }
-            s = AppKit.NSAttributedString.alloc().initWithString_attributes_(self._progress_text, attrs)
-            size = s.size()
-            s.drawAtPoint_((sw / 2 - size.width / 2, 30))
+            s = self._cached_string(self._progress_text, self._progress_attrs)
+            self._draw_centered(s, 30, sw, rect)
 
         # Instruction text
         if self._instruction_text:
-            attrs = {
-                AppKit.NSFontAttributeName: NSFont.systemFontOfSize_(14),
-                AppKit.NSForegroundColorAttributeName: NSColor.colorWithCalibratedWhite_alpha_(0.5, 1.0),
-            }
-            s = AppKit.NSAttributedString.alloc().initWithString_attributes_(self._instruction_text, attrs)
-            size = s.size()
-            s.drawAtPoint_((sw / 2 - size.width / 2, 60))
-
-        # Webcam preview
-        if self._webcam_image is not None:
-            self._webcam_image.drawInRect_fromRect_operation_fraction_(
-                ((sw - 180, 10), (160, 120)),
-                ((0, 0), (self._webcam_image.size().width, self._webcam_image.size().height)),
-                NSCompositingOperationSourceOver,
-                0.7,
-            )
-
-    def _draw_results(self, sw, sh):
+            s = self._cached_string(self._instruction_text, self._hint_attrs)
+            self._draw_centered(s, 60, sw, rect)
+
+    @objc.python_method
+    def _draw_results(self, sw, sh, rect):
         """Draw calibration accuracy results."""
         # Title
-        title_attrs = {
-            AppKit.NSFontAttributeName: NSFont.boldSystemFontOfSize_(28),
-            AppKit.NSForegroundColorAttributeName: NSColor.whiteColor(),
-        }
-        title = AppKit.NSAttributedString.alloc().initWithString_attributes_("Calibration Results", title_attrs)
-        ts = title.size()
-        title.drawAtPoint_((sw / 2 - ts.width / 2, sh - 60))
-
-        # Draw target/prediction pairs
-        for (tx, ty, px, py, err) in self._result_points:
-            # Flip Y
-            ty_f = sh - ty
-            py_f = sh - py
-
-            # Target point (green circle)
-            r = 6
-            NSColor.greenColor().setFill()
-            path = AppKit.NSBezierPath.bezierPathWithOvalInRect_(((tx - r, ty_f - r), (r * 2, r * 2)))
-            path.fill()
-
-            # Predicted point (red circle)
-            NSColor.redColor().setFill()
-            path = AppKit.NSBezierPath.bezierPathWithOvalInRect_(((px - r, py_f - r), (r * 2, r * 2)))
-            path.fill()
-
-            # Line between them
-            NSColor.colorWithCalibratedWhite_alpha_(0.4, 1.0).setStroke()
-            line = AppKit.NSBezierPath.bezierPath()
-            line.moveToPoint_((tx, ty_f))
-            line.lineToPoint_((px, py_f))
-            line.setLineWidth_(1.0)
-            line.stroke()
+        self._draw_centered(self._results_title, sh - 60, sw, rect)
 
         # Stats text
-        stats_attrs = {
-            AppKit.NSFontAttributeName: NSFont.systemFontOfSize_(18),
-            AppKit.NSForegroundColorAttributeName: NSColor.whiteColor(),
-        }
         stats_text = f"Mean error: {self._mean_error:.0f}px ({self._mean_error_pct:.1f}% of screen)"
-        s = AppKit.NSAttributedString.alloc().initWithString_attributes_(stats_text, stats_attrs)
-        ss = s.size()
-        s.drawAtPoint_((sw / 2 - ss.width / 2, sh - 100))
+        s = self._cached_string(stats_text, self._stats_attrs)
+        self._draw_centered(s, sh - 100, sw, rect)
 
         if self._show_warning:
-            warn_attrs = {
-                AppKit.NSFontAttributeName: NSFont.boldSystemFontOfSize_(16),
-                AppKit.NSForegroundColorAttributeName: NSColor.yellowColor(),
-            }
-            warn = AppKit.NSAttributedString.alloc().initWithString_attributes_(
-                "Warning: High calibration error. Consider recalibrating.", warn_attrs
-            )
-            ws = warn.size()
-            warn.drawAtPoint_((sw / 2 - ws.width / 2, sh - 130))
+            self._draw_centered(self._warning_string, sh - 130, sw, rect)
 
         # Legend
-        legend_attrs = {
-            AppKit.NSFontAttributeName: NSFont.systemFontOfSize_(14),
-            AppKit.NSForegroundColorAttributeName: NSColor.colorWithCalibratedWhite_alpha_(0.6, 1.0),
-        }
-        legend = AppKit.NSAttributedString.alloc().initWithString_attributes_(
-            "Green = target    Red = predicted gaze    Click 'Accept' or 'Redo'", legend_attrs
-        )
-        ls = legend.size()
-        legend.drawAtPoint_((sw / 2 - ls.width / 2, 80))
+        self._draw_centered(self._legend_string, 80, sw, rect)
 
     def isFlipped(self):
         return False
@@ -238,18 +367,20 @@ class CalibrationView(NSView):
 class CalibrationController:
     """Manages the calibration window and data collection process."""
 
-    def __init__(self, gaze_estimator, webcam_capture, on_complete,
+    def __init__(self, gaze_estimator, frame_grabber, on_complete,
                  on_cancel=None, on_open_settings=None):
         """
         Args:
             gaze_estimator: GazeEstimator instance
-            webcam_capture: cv2.VideoCapture instance
+            frame_grabber: running FrameGrabber for the webcam
             on_complete: callback(success: bool) called when calibration finishes
             on_cancel: optional callback() if user cancels
             on_open_settings: optional callback() to open settings window
         """
         self.estimator = gaze_estimator
-        self.capture = webcam_capture
+        # Frames come from the app's capture thread, so the UI never waits on
+        # the camera
+        self._grabber = frame_grabber
         self.on_complete = on_complete
         self.on_cancel = on_cancel
         self.on_open_settings = on_open_settings
@@ -260,17 +391,46 @@ class CalibrationController:
         self.screen_height = self.screen_frame.size.height
 
         self.points = generate_calibration_points(self.screen_width, self.screen_height)
-        self.collected_features = []
-        self.collected_screen_pts = []
+        # One averaged float32 feature row and target per accepted point
+        self.collected_features = np.empty((len(self.points), FEATURE_DIM), dtype=np.float32)
+        self.collected_screen_pts = np.empty((len(self.points), 2), dtype=np.float32)
+        self._collected_n = 0
 
         self.current_point_idx = 0
         self.state = "instructions"  # instructions, animating, settling, collecting, results
         self.state_start_time = 0
-        self.frame_features_buffer = []
-        self._last_frame = None
+        # Per-point samples are written row by row into a preallocated buffer
+        self._features_buf = np.empty((MAX_COLLECT_FRAMES, FEATURE_DIM), dtype=np.float32)
+        self._features_n = 0
+        self._collected_frame_id = 0
+
+        # Thumbnail pixels live in persistent RGB buffers that a CGImage
+        # reads directly, so no per-frame NSImage/NSBitmapImageRep is built.
+        # CGImageCreate doesn't copy, so the slot on screen is never written:
+        # updates all happen on the main thread, so two slots alternating is
+        # enough.
+        self._thumb_bufs = [
+            np.empty((THUMB_HEIGHT, THUMB_WIDTH, 3), dtype=np.uint8)
+            for _ in range(2)
+        ]
+        self._thumb_providers = [
+            Quartz.CGDataProviderCreateWithData(None, buf, buf.nbytes, None)
+            for buf in self._thumb_bufs
+        ]
+        self._thumb_shown_slot = 0
+        # Device RGB, as in the webcam preview: no colour matching needed
+        self._thumb_colorspace = Quartz.CGColorSpaceCreateDeviceRGB()
+        self._thumb_frame_id = 0
 
         self._setup_window()
-        self._timer = None
+        # Each timer only runs while its phase needs it (see start()).
+        # The scale-in is driven by the display refresh when possible, with a
+        # 60Hz timer as fallback.
+        self._display_link = DisplayLink(self._animate_frame)
+        self._animate_timer = None
+        self._collect_timer = None
+        self._phase_timer = None
+        self._preview_timer = None
         self._accept_button = None
         self._redo_button = None
         self._settings_button = None
@@ -310,11 +470,12 @@ class CalibrationController:
         self.view._phase = "instructions"
         self.view.setNeedsDisplay_(True)
 
-        # Start the update timer (60fps for smooth animation)
-        self._timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-            1.0 / 60.0, self, "tick:", None, True
-        )
-        NSRunLoop.currentRunLoop().addTimer_forMode_(self._timer, NSDefaultRunLoopMode)
+        # A redo arrives here from the results screen, where decoding is off
+        self._grabber.set_decode(True)
+
+        # Phases advance on one-shot timers; only the thumbnail refreshes
+        # continuously
+        self._preview_timer = self._start_timer(THUMB_MIN_INTERVAL, "refreshPreview:", True)
 
         # Listen for key/click to start
         self._event_monitor = AppKit.NSEvent.addLocalMonitorForEventsMatchingMask_handler_(
@@ -340,12 +501,12 @@ class CalibrationController:
                 btn_frame = self._settings_button.frame()
                 if AppKit.NSPointInRect(loc, btn_frame):
                     return event
-            self.state = "animating"
-            self.state_start_time = time.time()
             self.current_point_idx = 0
             self.view._phase = "calibrating"
             self.view._instruction_text = "Keep your head still and look at each dot"
-            self._update_target_position()
+            # The instruction screen text is replaced by the progress strip
+            self.view.setNeedsDisplay_(True)
+            self._enter_animating()
             # Hide settings button during active calibration
             if self._settings_button:
                 self._settings_button.setHidden_(True)
@@ -360,148 +521,201 @@ class CalibrationController:
             return None  # Consume the event
         return event
 
-    def tick_(self, timer):
-        """Called every frame to update calibration state."""
-        now = time.time()
-        elapsed = now - self.state_start_time
-
-        if self.state == "animating":
-            # Scale-in animation over 0.3s
-            progress = min(elapsed / 0.3, 1.0)
-            # Ease-out
-            self.view._target_scale = 1.0 - (1.0 - progress) ** 3
-            self.view._target_visible = True
-            if progress >= 1.0:
-                self.state = "settling"
-                self.state_start_time = now
-
-        elif self.state == "settling":
-            self.view._target_scale = 1.0
-            # Wait 0.5s for user's eyes to settle
-            if elapsed >= 0.5:
-                self.state = "collecting"
-                self.state_start_time = now
-                self.frame_features_buffer = []
-
+    def _start_timer(self, interval, selector, repeats):
+        timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+            interval, self, selector, None, repeats
+        )
+        NSRunLoop.currentRunLoop().addTimer_forMode_(timer, NSDefaultRunLoopMode)
+        return timer
+
+    def _stop_timers(self):
+        self._display_link.stop()
+        for name in ("_animate_timer", "_collect_timer", "_phase_timer", "_preview_timer"):
+            timer = getattr(self, name)
+            if timer:
+                timer.invalidate()
+                setattr(self, name, None)
+
+    def _enter_animating(self):
+        """Show the next target and scale it in at 60fps."""
+        self.state = "animating"
+        self.state_start_time = time.monotonic()
+        self._update_target_position()
+        self.view._target_scale = 0.0
+        self.view._target_visible = True
+        if not self._display_link.start():
+            self._animate_timer = self._start_timer(ANIMATE_INTERVAL, "animate:", True)
+
+    def animate_(self, timer):
+        self._animate_frame()
+
+    def _animate_frame(self):
+        """Drive the target scale-in; stops itself once the target is full size."""
+        frame = min(int((time.monotonic() - self.state_start_time) * 60), ANIMATE_FRAMES - 1)
+        self.view._target_scale = _EASE_LUT[frame]
+        self.view._update_target_layers()
+        if frame == ANIMATE_FRAMES - 1:
+            self._display_link.stop()
+            if self._animate_timer:
+                self._animate_timer.invalidate()
+                self._animate_timer = None
+            self._enter_settling()
+
+    def _enter_settling(self):
+        self.state = "settling"
+        self.state_start_time = time.monotonic()
+        self._phase_timer = self._start_timer(SETTLE_DURATION, "advancePhase:", False)
+
+    def _enter_collecting(self):
+        # Frames captured before this point are ignored by _collect_frame
+        self.state = "collecting"
+        self.state_start_time = time.monotonic()
+        self._features_n = 0
+        # The thumbnail is frozen while sampling: it would only distract from
+        # the target and compete with process_frame for the main thread
+        self._preview_timer.invalidate()
+        self._preview_timer = None
+        self._collect_timer = self._start_timer(COLLECT_INTERVAL, "collect:", True)
+        self._phase_timer = self._start_timer(COLLECT_DURATION, "advancePhase:", False)
+
+    def _enter_transitioning(self):
+        """Hide the target for a brief pause between points."""
+        self.state = "transitioning"
+        self.state_start_time = time.monotonic()
+        self.view._target_visible = False
+        self.view._update_target_layers()
+        self._preview_timer = self._start_timer(THUMB_MIN_INTERVAL, "refreshPreview:", True)
+        self._phase_timer = self._start_timer(TRANSITION_DURATION, "advancePhase:", False)
+
+    def advancePhase_(self, timer):
+        """One-shot timer fired when the current timed phase is over."""
+        self._phase_timer = None
+        if self.state == "settling":
+            self._enter_collecting()
         elif self.state == "collecting":
-            # Collect frames for 1.5s
-            self._collect_frame()
-            self.view._target_scale = 1.0
-            if elapsed >= 1.5:
-                self._finish_point_collection()
-
+            self._collect_timer.invalidate()
+            self._collect_timer = None
+            self._finish_point_collection()
         elif self.state == "transitioning":
-            # Brief pause between points
-            self.view._target_visible = False
-            if elapsed >= 0.15:
-                if self.current_point_idx < len(self.points):
-                    self.state = "animating"
-                    self.state_start_time = now
-                    self._update_target_position()
-                else:
-                    self._finish_calibration()
-
-        # Update webcam preview
+            if self.current_point_idx < len(self.points):
+                self._enter_animating()
+            else:
+                self._finish_calibration()
+
+    def collect_(self, timer):
+        self._collect_frame()
+
+    def refreshPreview_(self, timer):
         self._update_webcam_preview()
-        self.view.setNeedsDisplay_(True)
 
     def _update_target_position(self):
         """Set the target position for the current calibration point."""
         if self.current_point_idx < len(self.points):
-            x, y = self.points[self.current_point_idx]
+            x, y = self.points[self.current_point_idx].tolist()
             self.view._target_x = x
             self.view._target_y = y
             self.view._progress_text = f"Point {self.current_point_idx + 1} of {len(self.points)}"
+            self.view.invalidate_text_band()
 
     def _collect_frame(self):
-        """Capture a frame and extract features."""
-        ret, frame = self.capture.read()
-        if not ret:
+        """Extract features from the newest captured frame, if it is new."""
+        frame, timestamp, frame_id = self._grabber.latest()
+        if (frame is None or frame_id == self._collected_frame_id
+                or timestamp < self.state_start_time):
             return
-        self._last_frame = frame
-        features, confidence, _ = self.estimator.process_frame(frame)
-        if features is not None and confidence > 0.3:
-            self.frame_features_buffer.append(features)
+        self._collected_frame_id = frame_id
+        features, confidence, _ = self.estimator.process_frame(frame, timestamp)
+        if (features is not None and confidence > 0.3
+                and self._features_n < MAX_COLLECT_FRAMES):
+            self._features_buf[self._features_n] = features
+            self._features_n += 1
 
     def _update_webcam_preview(self):
-        """Update the small webcam preview in calibration view."""
-        if self._last_frame is None:
-            ret, frame = self.capture.read()
-            if not ret:
-                return
-            self._last_frame = frame
-        frame = self._last_frame
-        # Resize for thumbnail
-        small = cv2.resize(frame, (160, 120))
-        small_rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
-        h, w, c = small_rgb.shape
-        bytes_per_row = c * w
-        bitmap = NSBitmapImageRep.alloc().initWithBitmapDataPlanes_pixelsWide_pixelsHigh_bitsPerSample_samplesPerPixel_hasAlpha_isPlanar_colorSpaceName_bytesPerRow_bitsPerPixel_(
-            (small_rgb.tobytes(), None, None, None, None),
-            w, h, 8, 3, False, False, AppKit.NSCalibratedRGBColorSpace, bytes_per_row, 24
+        """Update the small webcam preview in calibration view.
+
+        Runs every THUMB_MIN_INTERVAL seconds and only re-uploads the
+        thumbnail when a new frame has been captured since the last update.
+        """
+        frame, _, frame_id = self._grabber.latest()
+        if frame is None or frame_id == self._thumb_frame_id:
+            return
+        self._thumb_frame_id = frame_id
+
+        # Resize for thumbnail: halve large frames with pyrDown first, then
+        # box-filter down with INTER_AREA
+        if frame.shape[1] >= 640:
+            frame = cv2.pyrDown(frame)
+        small = cv2.resize(frame, (THUMB_WIDTH, THUMB_HEIGHT), interpolation=cv2.INTER_AREA)
+        slot = 1 - self._thumb_shown_slot
+        cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._thumb_bufs[slot])
+        image = Quartz.CGImageCreate(
+            THUMB_WIDTH, THUMB_HEIGHT, 8, 24, THUMB_WIDTH * 3,
+            self._thumb_colorspace, Quartz.kCGImageAlphaNone,
+            self._thumb_providers[slot], None, False, Quartz.kCGRenderingIntentDefault,
         )
-        if bitmap:
-            image = NSImage.alloc().initWithSize_((w, h))
-            image.addRepresentation_(bitmap)
-            self.view._webcam_image = image
+        if image:
+            self.view._set_webcam_image(image)
+            self._thumb_shown_slot = slot
 
     def _finish_point_collection(self):
         """Process collected frames for current calibration point."""
-        if len(self.frame_features_buffer) >= 5:
-            features_array = np.array(self.frame_features_buffer)
-
-            # Remove outliers: discard features > 2 std from mean
-            mean = np.mean(features_array, axis=0)
-            std = np.std(features_array, axis=0) + 1e-8
-            distances = np.max(np.abs(features_array - mean) / std, axis=1)
-            mask = distances < 2.0
+        if self._features_n >= 5:
+            features_array = self._features_buf[:self._features_n]
+
+            # Remove outliers: discard features > 3 robust std from the median
+            # (MAD scaled by 1.4826 estimates std but isn't dragged by outliers)
+            med = np.median(features_array, axis=0)
+            deviation = np.abs(features_array - med)
+            mad = np.median(deviation, axis=0) + 1e-8
+            distances = np.max(deviation / (1.4826 * mad), axis=1)
+            mask = distances < 3.0
             filtered = features_array[mask]
 
             if len(filtered) >= 3:
-                avg_features = np.mean(filtered, axis=0)
-                self.collected_features.append(avg_features)
-                self.collected_screen_pts.append(self.points[self.current_point_idx])
+                self.collected_features[self._collected_n] = np.mean(filtered, axis=0)
+                self.collected_screen_pts[self._collected_n] = self.points[self.current_point_idx]
+                self._collected_n += 1
 
         self.current_point_idx += 1
-        self.state = "transitioning"
-        self.state_start_time = time.time()
+        self._enter_transitioning()
 
     def _finish_calibration(self):
         """Train the model and show results."""
-        if self._timer:
-            self._timer.invalidate()
-            self._timer = None
+        self._stop_timers()
 
-        if len(self.collected_features) < 10:
+        n = self._collected_n
+        if n < 10:
             self._show_failure("Not enough valid calibration points collected. "
-                             f"Got {len(self.collected_features)}, need at least 10.")
+                             f"Got {n}, need at least 10.")
             return
 
+        features = self.collected_features[:n]
+        targets = self.collected_screen_pts[:n]
+
         # Train the model
-        err_x, err_y = self.estimator.train_model(
-            self.collected_features, self.collected_screen_pts
-        )
+        err_x, err_y = self.estimator.train_model(features, targets)
 
-        # Compute per-point errors
-        result_points = []
-        total_error = 0
-        for feat, (tx, ty) in zip(self.collected_features, self.collected_screen_pts):
-            pred = self.estimator.predict(feat)
-            if pred:
-                px, py = pred
-                err = np.sqrt((px - tx) ** 2 + (py - ty) ** 2)
-                result_points.append((tx, ty, px, py, err))
-                total_error += err
-
-        mean_error = total_error / len(result_points) if result_points else 999
+        # Compute per-point errors in one batch
+        preds = self.estimator.predict_batch(features)
+        errors = np.linalg.norm(preds - targets, axis=1)
+        # Rows of (target_x, target_y, pred_x, pred_y, error_px) as plain floats
+        result_points = np.column_stack([targets, preds, errors]).tolist()
+
+        mean_error = float(errors.mean())
         mean_error_pct = (mean_error / self.screen_width) * 100
 
+        # Nothing reads frames on the results screen; keep the camera drained
+        # without decoding
+        self._grabber.set_decode(False)
+
         # Show results
         self.view._phase = "results"
         self.view._result_points = result_points
         self.view._mean_error = mean_error
         self.view._mean_error_pct = mean_error_pct
         self.view._show_warning = mean_error_pct > 5.0
+        self.view._update_target_layers()
+        self.view._build_result_layers()
 
         # Show settings button on results screen
         if self._settings_button:
@@ -544,28 +758,30 @@ class CalibrationController:
         """User wants to redo calibration."""
         self._cleanup()
         # Reset state
-        self.collected_features = []
-        self.collected_screen_pts = []
+        self._collected_n = 0
         self.current_point_idx = 0
         self._setup_window()
         self.start()
 
     def _show_failure(self, message):
         """Show calibration failure with retry option."""
+        self._grabber.set_decode(False)
         self.view._phase = "results"
         self.view._result_points = []
         self.view._mean_error = 999
         self.view._mean_error_pct = 100
         self.view._show_warning = True
+        self.view._update_target_layers()
+        self.view._build_result_layers()
         self._add_result_buttons()
         self._accept_button.setEnabled_(False)
         self.view.setNeedsDisplay_(True)
 
     def _cleanup(self):
         """Remove the calibration window."""
-        if self._timer:
-            self._timer.invalidate()
-            self._timer = None
+        self._stop_timers()
+        # The grabber belongs to the app and keeps running for tracking
+        self._grabber.set_decode(True)
         if self._event_monitor:
             AppKit.NSEvent.removeMonitor_(self._event_monitor)
             self._event_monitor = None
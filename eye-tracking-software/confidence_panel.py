@@ -2,7 +2,8 @@
 
 import objc
 import AppKit
-from Foundation import NSObject, NSPoint, NSRect, NSSize, NSMakeRect
+import Quartz
+from Foundation import NSObject, NSPoint, NSRect, NSSize, NSMakeRect, NSTimer
 from AppKit import (
     NSWindow, NSView, NSColor, NSFont, NSScreen,
     NSWindowStyleMaskBorderless, NSBackingStoreBuffered,
@@ -14,9 +15,26 @@ from AppKit import (
 )
 
 
+# AppKit names used while drawing, resolved once instead of per frame
+_NSFontAttr = AppKit.NSFontAttributeName
+_NSFgAttr = AppKit.NSForegroundColorAttributeName
+_NSAttrStr = AppKit.NSAttributedString
+
 PANEL_WIDTH = 200
 PANEL_HEIGHT = 80
 
+BAR_HEIGHT = 10
+BAR_RADIUS = 4
+
+# Seconds the panel has to rest after a move before its position is saved
+MOVE_SAVE_DELAY = 0.3
+
+STATUS_LABELS = {
+    "tracking": "Tracking",
+    "low_confidence": "Low confidence",
+    "face_lost": "Face not detected",
+}
+
 
 class ConfidencePanelView(NSView):
     """Custom view for the confidence panel content."""
@@ -25,15 +43,89 @@ class ConfidencePanelView(NSView):
         self = objc.super(ConfidencePanelView, self).initWithFrame_(frame)
         if self is None:
             return None
+        # Colours and text attributes are built once, not on every redraw
+        self._green = NSColor.colorWithCalibratedRed_green_blue_alpha_(0.2, 0.8, 0.3, 1.0)
+        self._amber = NSColor.colorWithCalibratedRed_green_blue_alpha_(0.9, 0.7, 0.1, 1.0)
+        self._red = NSColor.colorWithCalibratedRed_green_blue_alpha_(0.9, 0.2, 0.2, 1.0)
+        self._bar_bg_color = NSColor.colorWithCalibratedWhite_alpha_(0.2, 1.0)
+        status_font = NSFont.boldSystemFontOfSize_(13)
+        self._status_attrs_by_key = {
+            key: {
+                _NSFontAttr: status_font,
+                _NSFgAttr: color,
+            }
+            for key, color in (
+                ("tracking", self._green),
+                ("low_confidence", self._amber),
+                ("face_lost", self._red),
+            )
+        }
+        small_font = NSFont.systemFontOfSize_(11)
+        self._fps_attrs = {
+            _NSFontAttr: small_font,
+            _NSFgAttr: NSColor.colorWithCalibratedWhite_alpha_(0.6, 1.0),
+        }
+        self._pct_attrs = {
+            _NSFontAttr: small_font,
+            _NSFgAttr: NSColor.colorWithCalibratedWhite_alpha_(0.5, 1.0),
+        }
+
         self._status = "Initializing"
-        self._status_color = NSColor.grayColor()
+        self._status_attrs = {
+            _NSFontAttr: status_font,
+            _NSFgAttr: NSColor.grayColor(),
+        }
         self._confidence = 0.0
         self._fps = 0.0
         self._show_fps = True
-        self._dragging = False
-        self._drag_offset = (0, 0)
+
+        # Bar geometry is fixed, so the background path is built once
+        w = frame.size.width
+        h = frame.size.height
+        self._bar_rect = ((10, h - 40), (w - 20, BAR_HEIGHT))
+        self._bar_bg_path = AppKit.NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(
+            self._bar_rect, BAR_RADIUS, BAR_RADIUS
+        )
+
+        # The fill is a shape layer composited on top of the drawn background;
+        # its path is only rebuilt when the width moves by a whole pixel
+        self.setWantsLayer_(True)
+        self._fill_layer = Quartz.CAShapeLayer.layer()
+        self.layer().addSublayer_(self._fill_layer)
+        self._fill_width = -1
+        self._fill_color = None
         return self
 
+    @objc.python_method
+    def _update_fill(self):
+        """Sync the confidence fill layer with the current confidence."""
+        (bar_x, bar_y), (bar_w, bar_h) = self._bar_rect
+        fill_w = int(max(0, min(bar_w * self._confidence, bar_w)))
+        if self._confidence > 0.7:
+            fill_color = self._green
+        elif self._confidence > 0.4:
+            fill_color = self._amber
+        else:
+            fill_color = self._red
+        if fill_w == self._fill_width and fill_color is self._fill_color:
+            return
+
+        Quartz.CATransaction.begin()
+        Quartz.CATransaction.setDisableActions_(True)
+        if fill_w != self._fill_width:
+            self._fill_width = fill_w
+            if fill_w > 0:
+                radius = min(BAR_RADIUS, fill_w / 2)
+                self._fill_layer.setPath_(Quartz.CGPathCreateWithRoundedRect(
+                    ((bar_x, bar_y), (fill_w, bar_h)), radius, radius, None
+                ))
+            else:
+                self._fill_layer.setPath_(None)
+        if fill_color is not self._fill_color:
+            self._fill_color = fill_color
+            self._fill_layer.setFillColor_(fill_color.CGColor())
+        Quartz.CATransaction.commit()
+
     def drawRect_(self, rect):
         bounds = self.bounds()
         w = bounds.size.width
@@ -44,63 +136,28 @@ class ConfidencePanelView(NSView):
         y_offset = h - 18
 
         # Status text
-        status_attrs = {
-            AppKit.NSFontAttributeName: NSFont.boldSystemFontOfSize_(13),
-            AppKit.NSForegroundColorAttributeName: self._status_color,
-        }
-        status_str = AppKit.NSAttributedString.alloc().initWithString_attributes_(
-            self._status, status_attrs
+        status_str = _NSAttrStr.alloc().initWithString_attributes_(
+            self._status, self._status_attrs
         )
         status_str.drawAtPoint_((10, y_offset))
         y_offset -= 22
 
-        # Confidence bar
-        bar_x = 10
-        bar_y = y_offset
-        bar_w = w - 20
-        bar_h = 10
-
-        # Background
-        NSColor.colorWithCalibratedWhite_alpha_(0.2, 1.0).setFill()
-        bar_bg = AppKit.NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(
-            ((bar_x, bar_y), (bar_w, bar_h)), 4, 4
-        )
-        bar_bg.fill()
-
-        # Fill
-        fill_w = max(0, min(bar_w * self._confidence, bar_w))
-        if self._confidence > 0.7:
-            fill_color = NSColor.colorWithCalibratedRed_green_blue_alpha_(0.2, 0.8, 0.3, 1.0)
-        elif self._confidence > 0.4:
-            fill_color = NSColor.colorWithCalibratedRed_green_blue_alpha_(0.9, 0.7, 0.1, 1.0)
-        else:
-            fill_color = NSColor.colorWithCalibratedRed_green_blue_alpha_(0.9, 0.2, 0.2, 1.0)
-        fill_color.setFill()
-        bar_fill = AppKit.NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(
-            ((bar_x, bar_y), (fill_w, bar_h)), 4, 4
-        )
-        bar_fill.fill()
+        # Confidence bar background (the fill is _fill_layer)
+        self._bar_bg_color.setFill()
+        self._bar_bg_path.fill()
 
         y_offset -= 20
 
         # FPS text
         if self._show_fps:
-            fps_attrs = {
-                AppKit.NSFontAttributeName: NSFont.systemFontOfSize_(11),
-                AppKit.NSForegroundColorAttributeName: NSColor.colorWithCalibratedWhite_alpha_(0.6, 1.0),
-            }
-            fps_str = AppKit.NSAttributedString.alloc().initWithString_attributes_(
-                f"{self._fps:.0f} fps", fps_attrs
+            fps_str = _NSAttrStr.alloc().initWithString_attributes_(
+                f"{self._fps:.0f} fps", self._fps_attrs
             )
             fps_str.drawAtPoint_((10, y_offset))
 
         # Confidence percentage on right
-        pct_attrs = {
-            AppKit.NSFontAttributeName: NSFont.systemFontOfSize_(11),
-            AppKit.NSForegroundColorAttributeName: NSColor.colorWithCalibratedWhite_alpha_(0.5, 1.0),
-        }
-        pct_str = AppKit.NSAttributedString.alloc().initWithString_attributes_(
-            f"{self._confidence * 100:.0f}%", pct_attrs
+        pct_str = _NSAttrStr.alloc().initWithString_attributes_(
+            f"{self._confidence * 100:.0f}%", self._pct_attrs
         )
         pct_size = pct_str.size()
         pct_str.drawAtPoint_((w - pct_size.width - 10, y_offset))
@@ -111,29 +168,6 @@ class ConfidencePanelView(NSView):
     def acceptsFirstMouse_(self, event):
         return True
 
-    def mouseDown_(self, event):
-        self._dragging = True
-        window_frame = self.window().frame()
-        mouse_loc = AppKit.NSEvent.mouseLocation()
-        self._drag_offset = (
-            mouse_loc.x - window_frame.origin.x,
-            mouse_loc.y - window_frame.origin.y,
-        )
-
-    def mouseDragged_(self, event):
-        if self._dragging:
-            mouse_loc = AppKit.NSEvent.mouseLocation()
-            new_x = mouse_loc.x - self._drag_offset[0]
-            new_y = mouse_loc.y - self._drag_offset[1]
-            self.window().setFrameOrigin_((new_x, new_y))
-
-    def mouseUp_(self, event):
-        self._dragging = False
-        # Save position
-        if hasattr(self, '_on_position_changed') and self._on_position_changed:
-            frame = self.window().frame()
-            self._on_position_changed(frame.origin.x, frame.origin.y)
-
 
 class ConfidencePanelController:
     """Manages the confidence/quality floating panel."""
@@ -141,6 +175,9 @@ class ConfidencePanelController:
     def __init__(self, settings, on_position_changed=None):
         self.settings = settings
         self.on_position_changed = on_position_changed
+        # (status, confidence, fps) as last shown, rounded to what is displayed
+        self._last_shown = None
+        self._pending_move_timer = None
         self._setup_window()
 
     def _setup_window(self):
@@ -159,7 +196,8 @@ class ConfidencePanelController:
         self.window.setBackgroundColor_(NSColor.clearColor())
         self.window.setOpaque_(False)
         self.window.setHasShadow_(True)
-        self.window.setMovableByWindowBackground_(False)
+        # AppKit drags the panel itself; we only hear about where it ended up
+        self.window.setMovableByWindowBackground_(True)
         self.window.setIgnoresMouseEvents_(False)
 
         # Visual effect (blur) background
@@ -179,9 +217,32 @@ class ConfidencePanelController:
             NSMakeRect(0, 0, PANEL_WIDTH, PANEL_HEIGHT)
         )
         self.view._show_fps = self.settings.show_fps
-        self.view._on_position_changed = self.on_position_changed
         effect_view.addSubview_(self.view)
 
+        self._move_observer = AppKit.NSNotificationCenter.defaultCenter().addObserverForName_object_queue_usingBlock_(
+            AppKit.NSWindowDidMoveNotification, self.window, None, self._window_did_move
+        )
+
+    def _window_did_move(self, notification):
+        """Persist the panel position once the user has finished dragging it.
+
+        A drag posts a move notification for every step, so each one only
+        restarts a one-shot timer.  The timer sits in the default run loop
+        mode, which doesn't run during the drag's tracking loop, so it fires
+        after the mouse is released.
+        """
+        if self._pending_move_timer:
+            self._pending_move_timer.invalidate()
+        self._pending_move_timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+            MOVE_SAVE_DELAY, self, "flushPosition:", None, False
+        )
+
+    def flushPosition_(self, timer):
+        self._pending_move_timer = None
+        if self.on_position_changed:
+            frame = self.window.frame()
+            self.on_position_changed(frame.origin.x, frame.origin.y)
+
     def show(self):
         self.window.orderFront_(None)
 
@@ -196,19 +257,20 @@ class ConfidencePanelController:
             confidence: float 0-1
             fps: float
         """
-        if status == "tracking":
-            self.view._status = "Tracking"
-            self.view._status_color = NSColor.colorWithCalibratedRed_green_blue_alpha_(0.2, 0.8, 0.3, 1.0)
-        elif status == "low_confidence":
-            self.view._status = "Low confidence"
-            self.view._status_color = NSColor.colorWithCalibratedRed_green_blue_alpha_(0.9, 0.7, 0.1, 1.0)
-        else:
-            self.view._status = "Face not detected"
-            self.view._status_color = NSColor.colorWithCalibratedRed_green_blue_alpha_(0.9, 0.2, 0.2, 1.0)
+        if status not in STATUS_LABELS:
+            status = "face_lost"
+        shown = (status, round(confidence, 2), round(fps))
+        if shown == self._last_shown:
+            return
+        self._last_shown = shown
+
+        self.view._status = STATUS_LABELS[status]
+        self.view._status_attrs = self.view._status_attrs_by_key[status]
 
         self.view._confidence = confidence
         self.view._fps = fps
         self.view._show_fps = self.settings.show_fps
+        self.view._update_fill()
         self.view.setNeedsDisplay_(True)
 
     def update_settings(self, settings):
@@ -0,0 +1,59 @@
+"""Display-synchronised main-thread callbacks built on CVDisplayLink."""
+
+import Quartz
+from PyObjCTools import AppHelper
+
+
+class DisplayLink:
+    """Calls a function on the main thread once per display refresh.
+
+    CVDisplayLink fires on its own high-priority thread in step with the
+    display's real refresh rate (60, 59.94, 120Hz...), so updates line up
+    with compositor passes instead of beating against them like a fixed
+    NSTimer.  Each refresh is forwarded to the main thread with
+    AppHelper.callAfter; while a forwarded call is still pending, further
+    refreshes are dropped so a slow callback never builds up a backlog.
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+        self._pending = False
+        self._running = False
+        err, self._link = Quartz.CVDisplayLinkCreateWithActiveCGDisplays(None)
+        if err != Quartz.kCVReturnSuccess or self._link is None:
+            print(f"CVDisplayLink unavailable (error {err})")
+            self._link = None
+            return
+        # Keep a reference: the bound method must outlive the C callback
+        self._output_callback = self._on_refresh
+        Quartz.CVDisplayLinkSetOutputCallback(self._link, self._output_callback, None)
+
+    @property
+    def available(self):
+        return self._link is not None
+
+    def start(self):
+        """Start delivering callbacks. Returns False if no display link exists."""
+        if self._link is None:
+            return False
+        if not self._running:
+            self._running = True
+            Quartz.CVDisplayLinkStart(self._link)
+        return True
+
+    def stop(self):
+        if self._link is not None and self._running:
+            self._running = False
+            Quartz.CVDisplayLinkStop(self._link)
+
+    def _on_refresh(self, link, now, output_time, flags_in, flags_out, context):
+        # Runs on the CVDisplayLink thread
+        if not self._pending:
+            self._pending = True
+            AppHelper.callAfter(self._fire)
+        return Quartz.kCVReturnSuccess
+
+    def _fire(self):
+        self._pending = False
+        if self._running:
+            self.callback()
@@ -0,0 +1,90 @@
+"""Background webcam capture thread that always holds the newest frame."""
+
+import queue
+import threading
+import time
+
+
+class FrameGrabber(threading.Thread):
+    """Continuously reads frames from a cv2.VideoCapture on a daemon thread.
+
+    Consumers call latest() to get the most recent frame without waiting on
+    camera I/O, or get() to take each new frame at most once.  Only a single
+    frame slot is kept: each new frame replaces the previous one by
+    reference, so a consumer still holding an older frame is never written to
+    and the driver buffer never backs up.
+
+    When nobody needs pixels, set_decode(False) makes the thread only grab()
+    frames: the driver buffer stays drained but nothing is decoded.
+    """
+
+    def __init__(self, capture):
+        super().__init__(name="FrameGrabber", daemon=True)
+        self.capture = capture
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._frame = None
+        self._timestamp = 0.0
+        self._frame_id = 0
+        # Size-1 hand-off for get(): a new frame evicts an unconsumed one
+        self._queue = queue.Queue(maxsize=1)
+        self._decode = threading.Event()
+        self._decode.set()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            if not self.capture.grab():
+                time.sleep(0.01)
+                continue
+            if not self._decode.is_set():
+                continue
+            timestamp = time.monotonic()
+            ok, frame = self.capture.retrieve()
+            if not ok:
+                continue
+            with self._lock:
+                self._frame = frame
+                self._timestamp = timestamp
+                self._frame_id += 1
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._queue.put((frame, timestamp))
+
+    def latest(self):
+        """Return (frame, timestamp, frame_id) of the newest frame.
+
+        timestamp is the time.monotonic() at which the frame was grabbed.
+
+        frame is None until the first frame arrives.  frame_id increases by one
+        for every captured frame, so callers can tell whether it is new.
+        """
+        with self._lock:
+            return self._frame, self._timestamp, self._frame_id
+
+    def get(self, timeout=0.0):
+        """Take the newest frame not yet returned by get().
+
+        Waits up to timeout seconds for one (0 means don't wait).  Returns
+        (frame, timestamp), or (None, 0.0) if no new frame is available.
+        """
+        try:
+            if timeout > 0:
+                return self._queue.get(timeout=timeout)
+            return self._queue.get_nowait()
+        except queue.Empty:
+            return None, 0.0
+
+    def set_decode(self, decode):
+        """Turn decoding of grabbed frames on or off."""
+        if decode:
+            self._decode.set()
+        else:
+            self._decode.clear()
+
+    def stop(self):
+        """Signal the capture loop to exit and wait for it to finish."""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout=1.0)
@@ -1,6 +1,8 @@
 """Gaze estimation: feature extraction from MediaPipe landmarks + regression."""
 
 import os
+import threading
+import time
 import numpy as np
 import cv2
 import mediapipe as mp
@@ -8,9 +10,12 @@ from sklearn.linear_model import Ridge
 from sklearn.preprocessing import PolynomialFeatures
 from sklearn.pipeline import Pipeline
 from sklearn.model_selection import cross_val_score
+from sklearn.multioutput import MultiOutputRegressor
 from sklearn.gaussian_process import GaussianProcessRegressor
 from sklearn.gaussian_process.kernels import RBF, WhiteKernel
 
+from gaze_kernels import compute_features
+
 # MediaPipe Face Mesh landmark indices
 # Left eye corners
 LEFT_EYE_INNER = 133
@@ -28,6 +33,20 @@ RIGHT_EYE_BOTTOM = 374
 LEFT_IRIS = [468, 469, 470, 471, 472]   # centre, right, top, left, bottom
 RIGHT_IRIS = [473, 474, 475, 476, 477]  # centre, right, top, left, bottom
 
+# Both eyes' landmarks as (left, right) index pairs, for normalising the
+# iris position of both eyes in one pass. The horizontal axis of each eye
+# runs from its start corner to its end corner.
+_IRIS_CENTER_IDS = [LEFT_IRIS[0], RIGHT_IRIS[0]]
+_EYE_START_IDS = [LEFT_EYE_OUTER, RIGHT_EYE_INNER]
+_EYE_END_IDS = [LEFT_EYE_INNER, RIGHT_EYE_OUTER]
+_EYE_TOP_IDS = [LEFT_EYE_TOP, RIGHT_EYE_TOP]
+_EYE_BOTTOM_IDS = [LEFT_EYE_BOTTOM, RIGHT_EYE_BOTTOM]
+# Gathered together in the row order gaze_kernels.compute_features expects
+_FEATURE_LANDMARK_IDS = np.array(
+    _IRIS_CENTER_IDS + _EYE_START_IDS + _EYE_END_IDS + _EYE_TOP_IDS + _EYE_BOTTOM_IDS,
+    dtype=np.intp,
+)
+
 # 3D model points for head pose estimation (generic face model)
 MODEL_POINTS = np.array([
     (0.0, 0.0, 0.0),             # Nose tip (1)
@@ -40,154 +59,266 @@ MODEL_POINTS = np.array([
 
 # Corresponding MediaPipe landmark indices
 POSE_LANDMARK_IDS = [1, 152, 33, 263, 61, 291]
+POSE_LANDMARK_IDS_NP = np.array(POSE_LANDMARK_IDS, dtype=np.intp)
+
+# Mean landmark movement (pixels) below which the last head pose is reused
+POSE_REUSE_THRESHOLD = 0.5
+
+# Rotation vector of an unsolved pose (zero yaw and pitch)
+_NO_ROTATION = np.zeros(3)
+
+# Length of the feature vector returned by process_frame:
+# left iris (x, y), right iris (x, y), head yaw, head pitch
+FEATURE_DIM = 6
+
+# Frames wider than this are downscaled before inference; the landmarker
+# works from small face crops, so extra resolution only costs time
+MAX_INFERENCE_WIDTH = 640
 
 # Path to face landmarker model (next to this script)
 MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "face_landmarker.task")
 
 
+class _LandmarkerState:
+    """Per-landmarker feature buffer and head-pose warm-start state.
+
+    The VIDEO (calibration, main thread) and LIVE_STREAM (tracking,
+    MediaPipe's thread) paths each have their own, so a late live result can
+    never write into what calibration is using.
+    """
+
+    def __init__(self):
+        # Feature vector returned for each frame, refilled in place
+        self.feat_buf = np.empty(FEATURE_DIM, dtype=np.float32)
+        # Last solved head pose, used to warm-start the next solve
+        self.rvec = np.zeros((3, 1), dtype=np.float64)
+        self.tvec = np.zeros((3, 1), dtype=np.float64)
+        self.have_pose = False
+        # Landmark points the last pose was solved from
+        self.last_pose_pts = None
+
+
 class GazeEstimator:
     """Extracts eye/gaze features and runs gaze regression."""
 
     def __init__(self):
-        BaseOptions = mp.tasks.BaseOptions
-        FaceLandmarker = mp.tasks.vision.FaceLandmarker
-        FaceLandmarkerOptions = mp.tasks.vision.FaceLandmarkerOptions
-        RunningMode = mp.tasks.vision.RunningMode
-
-        options = FaceLandmarkerOptions(
-            base_options=BaseOptions(model_asset_path=MODEL_PATH),
-            running_mode=RunningMode.VIDEO,
+        # VIDEO mode serves calibration, which needs a result for every frame
+        # it collects; tracking uses a LIVE_STREAM landmarker, created on first
+        # use, that delivers results asynchronously and drops frames it can't
+        # keep up with
+        self.landmarker = self._create_landmarker(mp.tasks.vision.RunningMode.VIDEO)
+        self._live_landmarker = None
+        # Landmarker timestamps: milliseconds of capture time since _t0,
+        # forced strictly increasing for each landmarker
+        self._t0 = time.monotonic()
+        self._timestamp_ms = 0
+        self._live_timestamp_ms = 0
+        # Frames handed to detect_async, by timestamp, until their result
+        # arrives; results with no entry here are dropped
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        # Persistent RGB conversion buffer, reallocated if the frame size changes
+        self._rgb_buf = None
+
+        # Feature buffer and pose state of each landmarker
+        self._video_state = _LandmarkerState()
+        self._live_state = _LandmarkerState()
+
+        # Maps (N, FEATURE_DIM) features to (N, 2) screen points
+        self.model = None
+        # Closed form of the Ridge model, filled in by train_model when the
+        # polynomial model wins: monomial exponents (n_terms, FEATURE_DIM),
+        # stacked x/y coefficients (2, n_terms) and intercepts (2,)
+        self._poly_powers = None
+        self._poly_coef = None
+        self._poly_intercept = None
+        # Same for the GP model: training inputs (N, FEATURE_DIM), dual
+        # coefficients (N, 2) and per-axis 1 / (2 * length_scale^2)
+        self._gp_X = None
+        self._gp_alpha = None
+        self._gp_inv_2l2 = None
+        # ((width, height), camera matrix), swapped as one value so both
+        # landmarker threads always see a matching pair
+        self._camera = None
+        self._dist_coeffs = np.zeros((4, 1), dtype=np.float64)
+
+    @staticmethod
+    def _create_landmarker(running_mode, result_callback=None):
+        """Create a single-face FaceLandmarker in the given running mode."""
+        options = mp.tasks.vision.FaceLandmarkerOptions(
+            base_options=mp.tasks.BaseOptions(model_asset_path=MODEL_PATH),
+            running_mode=running_mode,
             num_faces=1,
             min_face_detection_confidence=0.5,
             min_tracking_confidence=0.5,
             output_face_blendshapes=False,
             output_facial_transformation_matrixes=False,
+            result_callback=result_callback,
         )
-        self.landmarker = FaceLandmarker.create_from_options(options)
-        self._timestamp_ms = 0
-
-        self.model_x = None
-        self.model_y = None
-        self._camera_matrix = None
-        self._dist_coeffs = np.zeros((4, 1), dtype=np.float64)
+        return mp.tasks.vision.FaceLandmarker.create_from_options(options)
 
     def _get_camera_matrix(self, frame_width, frame_height):
         """Build approximate camera intrinsic matrix."""
-        if self._camera_matrix is None or self._camera_matrix[0, 2] != frame_width / 2:
+        camera = self._camera
+        if camera is None or camera[0] != (frame_width, frame_height):
             focal_length = frame_width
             center = (frame_width / 2, frame_height / 2)
-            self._camera_matrix = np.array([
+            camera = ((frame_width, frame_height), np.array([
                 [focal_length, 0, center[0]],
                 [0, focal_length, center[1]],
                 [0, 0, 1],
-            ], dtype=np.float64)
-        return self._camera_matrix
+            ], dtype=np.float64))
+            self._camera = camera
+        return camera[1]
 
-    def process_frame(self, frame):
+    def process_frame(self, frame, timestamp=None):
         """Process a BGR frame and return (features, confidence, landmarks) or (None, 0, None).
 
+        timestamp is the frame's capture time from time.monotonic() (defaults
+        to now); MediaPipe's tracking uses it to follow motion between frames.
         landmarks is the list of NormalizedLandmark for the first face, or None.
+        features is a buffer the next frame overwrites; copy it to keep it.
         """
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
-
-        self._timestamp_ms += 33  # ~30fps
+        frame, mp_image = self._prepare_image(frame)
+        self._timestamp_ms = self._next_timestamp_ms(timestamp, self._timestamp_ms)
         result = self.landmarker.detect_for_video(mp_image, self._timestamp_ms)
+        h, w = frame.shape[:2]
+        return self._features_from_result(result, w, h, self._video_state)
+
+    def process_frame_async(self, frame, timestamp, on_result):
+        """Queue a BGR frame on the LIVE_STREAM landmarker and return at once.
+
+        on_result(features, confidence, landmarks, frame) is called later on
+        MediaPipe's callback thread, with the same values process_frame would
+        return plus the original frame.  MediaPipe drops frames it has no time
+        for, so not every call gets a callback.
+        """
+        if self._live_landmarker is None:
+            self._live_landmarker = self._create_landmarker(
+                mp.tasks.vision.RunningMode.LIVE_STREAM, self._on_mp_result
+            )
+        small, mp_image = self._prepare_image(frame)
+        self._live_timestamp_ms = self._next_timestamp_ms(timestamp, self._live_timestamp_ms)
+        h, w = small.shape[:2]
+        with self._pending_lock:
+            self._pending[self._live_timestamp_ms] = (frame, w, h, on_result)
+        self._live_landmarker.detect_async(mp_image, self._live_timestamp_ms)
+
+    def _on_mp_result(self, result, output_image, timestamp_ms):
+        # Runs on MediaPipe's callback thread.  Frames queued before this one
+        # were dropped by MediaPipe and will never get a result.
+        with self._pending_lock:
+            entry = self._pending.pop(timestamp_ms, None)
+            for ts in [ts for ts in self._pending if ts < timestamp_ms]:
+                del self._pending[ts]
+        if entry is None:
+            return
+        frame, w, h, on_result = entry
+        features, confidence, face = self._features_from_result(result, w, h, self._live_state)
+        on_result(features, confidence, face, frame)
+
+    def cancel_pending_async(self):
+        """Drop every frame still waiting on the LIVE_STREAM landmarker.
+
+        Their results are discarded when they arrive, without feature
+        extraction.  Call once no more frames are being submitted.
+        """
+        with self._pending_lock:
+            self._pending.clear()
+
+    def _prepare_image(self, frame):
+        """Downscale frame for inference and wrap it as an mp.Image.
 
+        Returns (frame, mp_image) where frame is the possibly downscaled BGR
+        frame the landmarks will be measured against.
+        """
+        fw = frame.shape[1]
+        if fw > MAX_INFERENCE_WIDTH:
+            scale = MAX_INFERENCE_WIDTH / fw
+            frame = cv2.resize(frame, (0, 0), fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        # mp.Image copies the pixels into its own ImageFrame when constructed,
+        # so it can't be kept and refilled in place; only the numpy buffer is
+        # reused.
+        return frame, mp.Image(image_format=mp.ImageFormat.SRGB, data=self._rgb_buf)
+
+    def _next_timestamp_ms(self, timestamp, last_ms):
+        """Milliseconds of capture time since _t0, forced past last_ms."""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        return max(int((timestamp - self._t0) * 1000), last_ms + 1)
+
+    def _features_from_result(self, result, w, h, state):
+        """Turn a FaceLandmarkerResult into (features, confidence, landmarks).
+
+        state is the _LandmarkerState of the landmarker that produced result.
+        """
         if not result.face_landmarks:
+            state.have_pose = False
             return None, 0.0, None
 
         face = result.face_landmarks[0]  # list of NormalizedLandmark
-        h, w = frame.shape[:2]
 
         if len(face) < 478:
             # No iris landmarks available
+            state.have_pose = False
             return None, 0.0, None
 
-        # Extract iris centres
-        left_iris_center = self._get_landmark_point(face, LEFT_IRIS[0], w, h)
-        right_iris_center = self._get_landmark_point(face, RIGHT_IRIS[0], w, h)
-
-        # Extract eye corners
-        left_inner = self._get_landmark_point(face, LEFT_EYE_INNER, w, h)
-        left_outer = self._get_landmark_point(face, LEFT_EYE_OUTER, w, h)
-        left_top = self._get_landmark_point(face, LEFT_EYE_TOP, w, h)
-        left_bottom = self._get_landmark_point(face, LEFT_EYE_BOTTOM, w, h)
-
-        right_inner = self._get_landmark_point(face, RIGHT_EYE_INNER, w, h)
-        right_outer = self._get_landmark_point(face, RIGHT_EYE_OUTER, w, h)
-        right_top = self._get_landmark_point(face, RIGHT_EYE_TOP, w, h)
-        right_bottom = self._get_landmark_point(face, RIGHT_EYE_BOTTOM, w, h)
-
-        # Normalised iris position within eye bounding box
-        left_iris_norm = self._normalise_iris(
-            left_iris_center, left_outer, left_inner, left_top, left_bottom
-        )
-        right_iris_norm = self._normalise_iris(
-            right_iris_center, right_inner, right_outer, right_top, right_bottom
-        )
-
-        # Head pose
-        yaw, pitch = self._estimate_head_pose(face, w, h)
-
-        features = np.array([
-            left_iris_norm[0], left_iris_norm[1],
-            right_iris_norm[0], right_iris_norm[1],
-            yaw, pitch,
-        ])
-
-        # Confidence: based on head pose (penalise extreme angles)
-        pose_penalty = max(0, 1.0 - (abs(yaw) + abs(pitch)) / 60.0)
-        confidence = float(np.clip(0.9 * pose_penalty, 0, 1))
+        # All landmarks as one (N, 2) array of pixel coordinates
+        pts = np.fromiter(
+            (c for lm in face for c in (lm.x, lm.y)), dtype=np.float32, count=len(face) * 2
+        ).reshape(-1, 2)
+        pts *= (w, h)
 
-        return features, confidence, face
+        # Head pose (solvePnP stays in OpenCV)
+        rvec = self._estimate_head_rotation(pts, w, h, state)
 
-    def _get_landmark_point(self, face, idx, w, h):
-        """Get 2D pixel coordinates for a landmark."""
-        lm = face[idx]
-        return np.array([lm.x * w, lm.y * h])
+        # Iris normalisation, Euler angles and confidence in one compiled call
+        confidence = compute_features(pts[_FEATURE_LANDMARK_IDS], rvec, state.feat_buf)
 
-    def _normalise_iris(self, iris_center, eye_left, eye_right, eye_top, eye_bottom):
-        """Normalise iris position within eye bounding box to [0,1]."""
-        eye_width = np.linalg.norm(eye_right - eye_left)
-        eye_height = np.linalg.norm(eye_bottom - eye_top)
+        return state.feat_buf, float(confidence), face
 
-        if eye_width < 1 or eye_height < 1:
-            return np.array([0.5, 0.5])
+    def _estimate_head_rotation(self, pts, w, h, state):
+        """Estimate the head rotation vector using solvePnP.
 
-        # Project iris onto eye axis
-        eye_horizontal = eye_right - eye_left
-        eye_vertical = eye_bottom - eye_top
-        iris_relative = iris_center - eye_left
-
-        norm_x = np.dot(iris_relative, eye_horizontal) / (eye_width ** 2)
-        norm_y = np.dot(iris_relative, eye_vertical) / (eye_height ** 2)
-
-        return np.array([np.clip(norm_x, 0, 1), np.clip(norm_y, 0, 1)])
+        pts is the (N, 2) array of landmark pixel coordinates; state holds the
+        previous pose to reuse or warm-start from.  Returns the
+        (3,) Rodrigues vector, or zeros (zero yaw and pitch) if the pose can't
+        be solved.
+        """
+        image_points = pts[POSE_LANDMARK_IDS_NP].astype(np.float64)
 
-    def _estimate_head_pose(self, face, w, h):
-        """Estimate head yaw and pitch using solvePnP."""
-        image_points = np.array([
-            self._get_landmark_point(face, idx, w, h)
-            for idx in POSE_LANDMARK_IDS
-        ], dtype=np.float64)
+        # A still head gives the same answer; skip the solve
+        if (state.have_pose
+                and np.abs(image_points - state.last_pose_pts).mean() < POSE_REUSE_THRESHOLD):
+            return state.rvec.ravel()
+        state.last_pose_pts = image_points
 
         camera_matrix = self._get_camera_matrix(w, h)
-        success, rotation_vec, _ = cv2.solvePnP(
-            MODEL_POINTS, image_points, camera_matrix, self._dist_coeffs,
-            flags=cv2.SOLVEPNP_ITERATIVE,
-        )
+        if state.have_pose:
+            # Consecutive frames barely move, so L-M from the last pose
+            # converges in an iteration or two
+            success, rotation_vec, translation_vec = cv2.solvePnP(
+                MODEL_POINTS, image_points, camera_matrix, self._dist_coeffs,
+                state.rvec, state.tvec, useExtrinsicGuess=True,
+                flags=cv2.SOLVEPNP_ITERATIVE,
+            )
+        else:
+            # No previous pose: solve globally from scratch
+            success, rotation_vec, translation_vec = cv2.solvePnP(
+                MODEL_POINTS, image_points, camera_matrix, self._dist_coeffs,
+                flags=cv2.SOLVEPNP_SQPNP,
+            )
 
+        state.have_pose = bool(success)
         if not success:
-            return 0.0, 0.0
-
-        rmat, _ = cv2.Rodrigues(rotation_vec)
-        # Decompose rotation matrix to Euler angles
-        sy = np.sqrt(rmat[0, 0] ** 2 + rmat[1, 0] ** 2)
-        pitch = np.degrees(np.arctan2(-rmat[2, 0], sy))
-        yaw = np.degrees(np.arctan2(rmat[2, 1], rmat[2, 2]))
-
-        return float(yaw), float(pitch)
+            return _NO_ROTATION
+        state.rvec = rotation_vec
+        state.tvec = translation_vec
+        return rotation_vec.ravel()
 
     def train_model(self, features_list, screen_points):
         """Train gaze regression models.
@@ -199,72 +330,99 @@ class GazeEstimator:
         Returns:
             (mean_error_x, mean_error_y) from cross-validation
         """
-        X = np.array(features_list)
-        y_x = np.array([p[0] for p in screen_points])
-        y_y = np.array([p[1] for p in screen_points])
+        X = np.asarray(features_list, dtype=np.float32)
+        y = np.asarray(screen_points, dtype=np.float32)
 
-        # Try Ridge with polynomial features
+        # Try Ridge with polynomial features; Ridge fits both axes at once,
+        # so the polynomial expansion is only computed once
         ridge_pipe = Pipeline([
             ('poly', PolynomialFeatures(degree=2, include_bias=False)),
             ('ridge', Ridge(alpha=1.0)),
         ])
 
-        # Cross-validate Ridge
+        # Cross-validate Ridge (MAE averaged over both axes)
         n_splits = min(5, len(X))
         if n_splits >= 2:
-            ridge_scores_x = -cross_val_score(ridge_pipe, X, y_x, cv=n_splits, scoring='neg_mean_absolute_error')
-            ridge_scores_y = -cross_val_score(ridge_pipe, X, y_y, cv=n_splits, scoring='neg_mean_absolute_error')
-            ridge_error = (ridge_scores_x.mean() + ridge_scores_y.mean()) / 2
+            ridge_error = -cross_val_score(
+                ridge_pipe, X, y, cv=n_splits, scoring='neg_mean_absolute_error'
+            ).mean()
         else:
             ridge_error = float('inf')
 
-        # Try Gaussian Process
+        # Try Gaussian Process (one per axis)
         gp_error = float('inf')
         if len(X) <= 50:  # GP is slow with many points
             try:
                 kernel = RBF(length_scale=1.0) + WhiteKernel(noise_level=1.0)
-                gp = GaussianProcessRegressor(kernel=kernel, n_restarts_optimizer=2)
+                gp = MultiOutputRegressor(
+                    # Unnormalised targets keep the mean a plain kernel sum
+                    # in predict
+                    GaussianProcessRegressor(
+                        kernel=kernel, normalize_y=False, n_restarts_optimizer=2
+                    )
+                )
                 if n_splits >= 2:
-                    gp_scores_x = -cross_val_score(gp, X, y_x, cv=n_splits, scoring='neg_mean_absolute_error')
-                    gp_scores_y = -cross_val_score(gp, X, y_y, cv=n_splits, scoring='neg_mean_absolute_error')
-                    gp_error = (gp_scores_x.mean() + gp_scores_y.mean()) / 2
+                    gp_error = -cross_val_score(
+                        gp, X, y, cv=n_splits, scoring='neg_mean_absolute_error'
+                    ).mean()
             except Exception:
                 pass
 
-        # Pick the better model
-        if gp_error < ridge_error:
-            kernel = RBF(length_scale=1.0) + WhiteKernel(noise_level=1.0)
-            self.model_x = GaussianProcessRegressor(kernel=kernel, n_restarts_optimizer=2)
-            self.model_y = GaussianProcessRegressor(kernel=kernel, n_restarts_optimizer=2)
+        # Pick the better model and fit it on all points
+        self.model = gp if gp_error < ridge_error else ridge_pipe
+        self.model.fit(X, y)
+
+        if self.model is ridge_pipe:
+            ridge = ridge_pipe.named_steps['ridge']
+            self._poly_powers = ridge_pipe.named_steps['poly'].powers_
+            self._poly_coef = ridge.coef_            # (2, n_terms)
+            self._poly_intercept = ridge.intercept_  # (2,)
+            self._gp_X = None
         else:
-            self.model_x = Pipeline([
-                ('poly', PolynomialFeatures(degree=2, include_bias=False)),
-                ('ridge', Ridge(alpha=1.0)),
-            ])
-            self.model_y = Pipeline([
-                ('poly', PolynomialFeatures(degree=2, include_bias=False)),
-                ('ridge', Ridge(alpha=1.0)),
-            ])
-
-        self.model_x.fit(X, y_x)
-        self.model_y.fit(X, y_y)
+            self._poly_powers = None
+            gps = self.model.estimators_
+            self._gp_X = gps[0].X_train_
+            self._gp_alpha = np.column_stack([m.alpha_ for m in gps])
+            self._gp_inv_2l2 = np.array([0.5 / m.kernel_.k1.length_scale ** 2 for m in gps])
 
         # Return training errors
-        pred_x = self.model_x.predict(X)
-        pred_y = self.model_y.predict(X)
-        err_x = np.mean(np.abs(pred_x - y_x))
-        err_y = np.mean(np.abs(pred_y - y_y))
+        err_x, err_y = np.mean(np.abs(self.model.predict(X) - y), axis=0)
         return err_x, err_y
 
     def predict(self, features):
         """Predict screen coordinates from feature vector."""
-        if self.model_x is None or self.model_y is None:
+        if self.model is None:
             return None
-        X = features.reshape(1, -1)
-        sx = float(self.model_x.predict(X)[0])
-        sy = float(self.model_y.predict(X)[0])
+        if self._poly_powers is not None:
+            # Evaluate the polynomial directly: one row of monomials, one matmul
+            phi = np.prod(features ** self._poly_powers, axis=1)
+            sx, sy = (self._poly_coef @ phi + self._poly_intercept).tolist()
+            return sx, sy
+        if self._gp_X is not None:
+            # GP mean: RBF kernel vector against the training set dotted with
+            # alpha; the WhiteKernel term is zero away from training points
+            d2 = ((self._gp_X - features) ** 2).sum(axis=1)
+            k = np.exp(-d2[:, None] * self._gp_inv_2l2)
+            sx, sy = (k * self._gp_alpha).sum(axis=0).tolist()
+            return sx, sy
+        sx, sy = self.model.predict(features.reshape(1, -1))[0].tolist()
         return sx, sy
 
+    def predict_batch(self, features):
+        """Predict screen coordinates for an (N, 6) array of feature vectors.
+
+        Returns an (N, 2) array of (x, y), or None if no model is trained.
+        """
+        if self.model is None:
+            return None
+        X = np.asarray(features)
+        if self._poly_powers is not None:
+            phi = np.prod(X[:, None, :] ** self._poly_powers, axis=2)
+            return phi @ self._poly_coef.T + self._poly_intercept
+        return self.model.predict(X)
+
     def close(self):
         """Release resources."""
         self.landmarker.close()
+        if self._live_landmarker is not None:
+            self._live_landmarker.close()
@@ -0,0 +1,91 @@
+"""Compiled per-frame gaze feature math.
+
+Runs under numba when it is installed; otherwise the same functions run as
+plain Python, just slower.
+"""
+
+import math
+import sys
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# numba caches compiled code next to the module source; in the py2app bundle
+# that source sits inside a zip, where caching fails at import, so frozen
+# builds compile on first call instead
+NJIT_CACHE = not getattr(sys, "frozen", False)
+
+# 180 / pi
+_RAD_TO_DEG = 57.29577951308232
+
+
+@njit(cache=NJIT_CACHE, fastmath=True)
+def compute_features(eye_pts, rvec, out):
+    """Fill out with the 6 gaze features and return the tracking confidence.
+
+    eye_pts is a (10, 2) array of pixel coordinates, in (left, right) eye
+    pairs: iris centres, eye start corners, eye end corners, eye tops, eye
+    bottoms.  rvec is the (3,) Rodrigues head rotation vector (zeros if the
+    pose could not be solved).  out receives left iris (x, y), right iris (x, y)
+    normalised to [0, 1] within the eye box, then head yaw and pitch in
+    degrees.
+    """
+    for e in range(2):
+        ox = eye_pts[2 + e, 0]
+        oy = eye_pts[2 + e, 1]
+        hx = eye_pts[4 + e, 0] - ox
+        hy = eye_pts[4 + e, 1] - oy
+        vx = eye_pts[8 + e, 0] - eye_pts[6 + e, 0]
+        vy = eye_pts[8 + e, 1] - eye_pts[6 + e, 1]
+        rx = eye_pts[e, 0] - ox
+        ry = eye_pts[e, 1] - oy
+
+        # Project iris onto the eye axes (squared lengths; no sqrt needed)
+        width_sq = hx * hx + hy * hy
+        height_sq = vx * vx + vy * vy
+        if width_sq < 1.0 or height_sq < 1.0:
+            nx = 0.5
+            ny = 0.5
+        else:
+            nx = min(max((rx * hx + ry * hy) / width_sq, 0.0), 1.0)
+            ny = min(max((rx * vx + ry * vy) / height_sq, 0.0), 1.0)
+        out[2 * e] = nx
+        out[2 * e + 1] = ny
+
+    # Euler angles need only five entries of the rotation matrix, so build
+    # just those from the Rodrigues formula R = cI + s[k]x + (1 - c)kk^T
+    theta = math.sqrt(rvec[0] * rvec[0] + rvec[1] * rvec[1] + rvec[2] * rvec[2])
+    if theta < 1e-12:
+        r00 = 1.0
+        r10 = 0.0
+        r20 = 0.0
+        r21 = 0.0
+        r22 = 1.0
+    else:
+        kx = rvec[0] / theta
+        ky = rvec[1] / theta
+        kz = rvec[2] / theta
+        c = math.cos(theta)
+        s = math.sin(theta)
+        t = 1.0 - c
+        r00 = c + kx * kx * t
+        r10 = kx * ky * t + kz * s
+        r20 = kx * kz * t - ky * s
+        r21 = ky * kz * t + kx * s
+        r22 = c + kz * kz * t
+
+    sy = math.sqrt(r00 * r00 + r10 * r10)
+    pitch = math.atan2(-r20, sy) * _RAD_TO_DEG
+    yaw = math.atan2(r21, r22) * _RAD_TO_DEG
+    out[4] = yaw
+    out[5] = pitch
+
+    # Confidence: based on head pose (penalise extreme angles)
+    pose_penalty = max(0.0, 1.0 - (abs(yaw) + abs(pitch)) / 60.0)
+    return min(max(0.9 * pose_penalty, 0.0), 1.0)
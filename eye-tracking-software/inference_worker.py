@@ -0,0 +1,131 @@
+"""Background gaze inference thread feeding results to the main thread."""
+
+import functools
+import queue
+import threading
+import time
+
+import cv2
+
+# Size of the greyscale thumbnail compared by the frame-difference gate
+DIFF_THUMB_SIZE = (40, 30)
+
+
+class InferenceWorker(threading.Thread):
+    """Runs face landmarking and gaze prediction off the main thread.
+
+    Takes each new frame from a FrameGrabber and feeds it to the
+    GazeEstimator's LIVE_STREAM landmarker, which works through frames at its
+    own pace and drops the ones it can't keep up with.  Results arrive on
+    MediaPipe's callback thread and are handed to the main thread through a
+    size-1 queue that only ever holds the newest result; poll it with
+    get_result().
+
+    The worker is started and stopped with tracking.  Calibration uses the
+    estimator's VIDEO landmarker on the main thread, with its own feature
+    buffer and head-pose state, and stop() drops any live results still in
+    flight, so a late callback can't disturb it.
+
+    Frames that barely differ from the last one inferred (mean absolute
+    difference of a tiny greyscale thumbnail below diff_threshold) reuse the
+    previous result instead of running inference again.
+
+    An exponential moving average of inference latency (submit to callback)
+    is kept; while it is above max_inference_ms, every other frame skips
+    inference and reuses the previous result, so a slow machine doesn't
+    stack up work.  The frame still goes out with it for the preview.
+    """
+
+    def __init__(self, estimator, frame_grabber, diff_threshold=0.0, max_inference_ms=0.0):
+        super().__init__(name="InferenceWorker", daemon=True)
+        self.estimator = estimator
+        self.frame_grabber = frame_grabber
+        self.diff_threshold = diff_threshold
+        self.max_inference_ms = max_inference_ms
+        self._ema_ms = 0.0
+        self._frame_count = 0
+        self._stop_event = threading.Event()
+        self._results = queue.Queue(maxsize=1)
+        # Thumbnail of the last frame actually inferred, and its result
+        self._ref_thumb = None
+        self._last_result = (None, 0.0, None)
+
+    def run(self):
+        while not self._stop_event.is_set():
+            frame, timestamp = self.frame_grabber.get(timeout=0.1)
+            if frame is None:
+                continue
+
+            self._frame_count += 1
+
+            if self._should_skip() or self._is_near_duplicate(frame):
+                self._publish(*self._last_result, frame)
+            else:
+                self.estimator.process_frame_async(
+                    frame, timestamp, functools.partial(self._on_features, time.monotonic())
+                )
+
+    def _should_skip(self):
+        """True if inference is running slow and this is an odd frame."""
+        return (0 < self.max_inference_ms < self._ema_ms
+                and self._frame_count % 2 == 1)
+
+    def _on_features(self, submitted, features, confidence, face_landmarks, frame):
+        # Runs on MediaPipe's callback thread
+        if self._stop_event.is_set():
+            return
+        elapsed_ms = (time.monotonic() - submitted) * 1000
+        self._ema_ms = 0.9 * self._ema_ms + 0.1 * elapsed_ms
+        prediction = None
+        if features is not None:
+            prediction = self.estimator.predict(features)
+        self._last_result = (prediction, confidence, face_landmarks)
+        self._publish(prediction, confidence, face_landmarks, frame)
+
+    def _publish(self, prediction, confidence, face_landmarks, frame):
+        """Replace whatever result is waiting with this one."""
+        try:
+            self._results.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self._results.put_nowait((prediction, confidence, face_landmarks, frame))
+        except queue.Full:
+            # The other producer thread got in first; its result is as fresh
+            pass
+
+    def _is_near_duplicate(self, frame):
+        """True if frame is close enough to the last inferred one to skip it.
+
+        The reference thumbnail only moves when inference runs, so slow drift
+        still adds up to a change instead of creeping under the threshold.
+        """
+        if self.diff_threshold <= 0:
+            return False
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        thumb = cv2.resize(gray, DIFF_THUMB_SIZE, interpolation=cv2.INTER_AREA)
+        if (self._ref_thumb is not None
+                and cv2.absdiff(thumb, self._ref_thumb).mean() < self.diff_threshold):
+            return True
+        self._ref_thumb = thumb
+        return False
+
+    def get_result(self):
+        """Return the newest (prediction, confidence, landmarks, frame), or None.
+
+        prediction is an (x, y) screen point, or None if no face was found or
+        no model is trained.  Never blocks.
+        """
+        try:
+            return self._results.get_nowait()
+        except queue.Empty:
+            return None
+
+    def stop(self):
+        """Signal the worker to exit; late MediaPipe callbacks are ignored."""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout=1.0)
+        # No more frames go in now; results for those still queued are
+        # dropped before any feature extraction
+        self.estimator.cancel_pending_async()
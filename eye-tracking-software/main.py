@@ -3,6 +3,7 @@
 import sys
 import time
 import threading
+from collections import deque
 import cv2
 import objc
 import AppKit
@@ -18,11 +19,18 @@ from AppKit import (
 from settings import Settings
 from gaze_estimator import GazeEstimator
 from calibration import CalibrationController
+from frame_grabber import FrameGrabber
+from inference_worker import InferenceWorker
 from overlay import OverlayController
 from confidence_panel import ConfidencePanelController
 from settings_window import SettingsWindowController
 from webcam_preview import WebcamPreviewController
 
+# Settings whose change means reopening the camera
+_CAMERA_SETTING_KEYS = frozenset((
+    "camera_device_index", "camera_resolution_w", "camera_resolution_h", "camera_fps",
+))
+
 
 class AppDelegate(NSObject):
     """Main application delegate — manages lifecycle and coordinates all components."""
@@ -35,6 +43,8 @@ class AppDelegate(NSObject):
         self.settings = Settings.load()
         self.estimator = GazeEstimator()
         self.capture = None
+        self.frame_grabber = None
+        self.inference_worker = None
         self.overlay = None
         self.confidence_panel = None
         self.settings_window = None
@@ -44,7 +54,7 @@ class AppDelegate(NSObject):
         self.is_tracking = False
 
         # FPS tracking
-        self._frame_times = []
+        self._frame_times = deque(maxlen=30)  # last 30 frame times
         self._current_fps = 0.0
 
         return self
@@ -63,6 +73,8 @@ class AppDelegate(NSObject):
     def applicationWillTerminate_(self, notification):
         """Clean up on quit."""
         self._stop_tracking()
+        if self.frame_grabber:
+            self.frame_grabber.stop()
         if self.capture:
             self.capture.release()
         self.estimator.close()
@@ -116,6 +128,13 @@ class AppDelegate(NSObject):
         self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, self.settings.camera_resolution_w)
         self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.settings.camera_resolution_h)
         self.capture.set(cv2.CAP_PROP_FPS, self.settings.camera_fps)
+        # Keep the driver queue short so frames are never stale
+        self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        # Read frames on a background thread so the main thread never blocks
+        # on camera I/O
+        self.frame_grabber = FrameGrabber(self.capture)
+        self.frame_grabber.start()
         return True
 
     def _switch_camera(self):
@@ -127,6 +146,9 @@ class AppDelegate(NSObject):
         was_tracking = self.is_tracking
         self._stop_tracking()
 
+        if self.frame_grabber:
+            self.frame_grabber.stop()
+            self.frame_grabber = None
         if self.capture:
             self.capture.release()
             self.capture = None
@@ -169,7 +191,7 @@ class AppDelegate(NSObject):
 
         self.calibration = CalibrationController(
             gaze_estimator=self.estimator,
-            webcam_capture=self.capture,
+            frame_grabber=self.frame_grabber,
             on_complete=self._on_calibration_complete,
             on_open_settings=self._open_settings_from_calibration,
         )
@@ -214,6 +236,14 @@ class AppDelegate(NSObject):
 
         self.is_tracking = True
 
+        # Inference runs on its own thread; the timer below only applies results
+        self.inference_worker = InferenceWorker(
+            self.estimator, self.frame_grabber,
+            diff_threshold=self.settings.frame_diff_threshold,
+            max_inference_ms=self.settings.max_inference_ms,
+        )
+        self.inference_worker.start()
+
         # Start tracking timer on main thread (30fps)
         self.tracking_timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
             1.0 / 30.0, self, "trackingTick:", None, True
@@ -236,6 +266,9 @@ class AppDelegate(NSObject):
         if self.tracking_timer:
             self.tracking_timer.invalidate()
             self.tracking_timer = None
+        if self.inference_worker:
+            self.inference_worker.stop()
+            self.inference_worker = None
         if hasattr(self, '_hotkey_monitor') and self._hotkey_monitor:
             AppKit.NSEvent.removeMonitor_(self._hotkey_monitor)
             self._hotkey_monitor = None
@@ -244,27 +277,22 @@ class AppDelegate(NSObject):
             self._local_hotkey_monitor = None
 
     def trackingTick_(self, timer):
-        """Main tracking loop — called ~30fps on the main thread."""
-        if not self.is_tracking or self.capture is None:
-            return
-
-        frame_start = time.time()
+        """Main tracking loop — called ~30fps on the main thread.
 
-        ret, frame = self.capture.read()
-        if not ret:
+        Only applies the newest InferenceWorker result to the UI; if none has
+        arrived since the last tick there is nothing to do.
+        """
+        if not self.is_tracking or self.inference_worker is None:
             return
 
-        features, confidence, face_landmarks = self.estimator.process_frame(frame)
+        result = self.inference_worker.get_result()
+        if result is None:
+            return
+        prediction, confidence, face_landmarks, frame = result
 
-        if features is not None:
-            prediction = self.estimator.predict(features)
-            if prediction:
-                raw_x, raw_y = prediction
-                face_detected = True
-            else:
-                raw_x, raw_y = 0, 0
-                face_detected = False
-                confidence = 0.0
+        if prediction:
+            raw_x, raw_y = prediction
+            face_detected = True
         else:
             raw_x, raw_y = 0, 0
             face_detected = False
@@ -291,8 +319,6 @@ class AppDelegate(NSObject):
         # FPS calculation
         frame_end = time.time()
         self._frame_times.append(frame_end)
-        # Keep last 30 frame times
-        self._frame_times = self._frame_times[-30:]
         if len(self._frame_times) >= 2:
             elapsed = self._frame_times[-1] - self._frame_times[0]
             if elapsed > 0:
@@ -387,23 +413,25 @@ class AppDelegate(NSObject):
 
     # --- Settings ---
 
-    def _on_settings_changed(self, new_settings):
-        """Called when settings are changed in the settings window."""
-        old = self.settings
+    def _on_settings_changed(self, new_settings, changed_keys):
+        """Called when settings are changed in the settings window.
+
+        changed_keys is the set of Settings field names that changed.  The
+        window edits the shared Settings object in place, so comparing old
+        and new values here would always find them equal.
+        """
         self.settings = new_settings
 
         # Detect camera config changes that require a device switch
-        camera_changed = (
-            old.camera_device_index != new_settings.camera_device_index
-            or old.camera_resolution_w != new_settings.camera_resolution_w
-            or old.camera_resolution_h != new_settings.camera_resolution_h
-            or old.camera_fps != new_settings.camera_fps
-        )
+        camera_changed = not changed_keys.isdisjoint(_CAMERA_SETTING_KEYS)
 
         if self.overlay:
             self.overlay.update_settings(new_settings)
         if self.confidence_panel:
             self.confidence_panel.update_settings(new_settings)
+        if self.inference_worker:
+            self.inference_worker.diff_threshold = new_settings.frame_diff_threshold
+            self.inference_worker.max_inference_ms = new_settings.max_inference_ms
 
         # Toggle webcam preview based on setting
         if new_settings.show_webcam_preview:
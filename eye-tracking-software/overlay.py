@@ -10,75 +10,93 @@ from AppKit import (
     NSWindowStyleMaskBorderless, NSBackingStoreBuffered,
 )
 
+from display_link import DisplayLink
+from smoothing import smooth_gaze, step_opacity
+
+# Squared distance (px^2) within which a new gaze sample is treated as the
+# same point as the last one, so micro-jitter during a fixation is dropped
+JITTER_EPS_SQ = 4.0
+
 
 class CrosshairView(NSView):
-    """Draws the crosshair at the current gaze position."""
+    """Shows the crosshair at the current gaze position.
+
+    The crosshair is a shadow and a main CAShapeLayer inside one container
+    layer, sharing a path centred on the origin that the controller builds
+    when the geometry changes; following the gaze is just a position write
+    on the container, and the stroking and compositing happen on the GPU.
+    """
 
     def initWithFrame_(self, frame):
         self = objc.super(CrosshairView, self).initWithFrame_(frame)
         if self is None:
             return None
-        self._gaze_x = 0
-        self._gaze_y = 0
-        self._opacity = 1.0
         self._color_r = 1.0
         self._color_g = 1.0
         self._color_b = 1.0
-        self._arm_length = 40
         self._line_width = 1.5
-        self._gap = 6
-        return self
-
-    def drawRect_(self, rect):
-        if self._opacity <= 0.01:
-            return
-
-        bounds = self.bounds()
-        sh = bounds.size.height
-
-        # Gaze position in AppKit coords (flip Y)
-        x = self._gaze_x
-        y = sh - self._gaze_y
-
-        arm = self._arm_length
-        gap = self._gap
-        lw = self._line_width
-
-        # Drop shadow (thin black outline)
-        shadow_color = NSColor.colorWithCalibratedRed_green_blue_alpha_(0.0, 0.0, 0.0, 0.5 * self._opacity)
-        shadow_color.setStroke()
-        self._draw_crosshair(x, y, arm, gap, lw + 1.5)
-
-        # Main crosshair
-        main_color = NSColor.colorWithCalibratedRed_green_blue_alpha_(
-            self._color_r, self._color_g, self._color_b, self._opacity
+        # Colour the main layer's stroke CGColor was built from, and the line
+        # width last pushed to the layers
+        self._stroke_rgb = None
+        self._applied_line_width = None
+
+        self.setWantsLayer_(True)
+        self._crosshair_layer = Quartz.CALayer.layer()
+        self._shadow_layer = Quartz.CAShapeLayer.layer()
+        self._main_layer = Quartz.CAShapeLayer.layer()
+        for layer in (self._shadow_layer, self._main_layer):
+            layer.setFillColor_(None)
+            layer.setLineCap_(Quartz.kCALineCapRound)
+            self._crosshair_layer.addSublayer_(layer)
+        # Thin black outline; the container's opacity fades both layers
+        self._shadow_layer.setStrokeColor_(
+            NSColor.colorWithCalibratedRed_green_blue_alpha_(0.0, 0.0, 0.0, 0.5).CGColor()
         )
-        main_color.setStroke()
-        self._draw_crosshair(x, y, arm, gap, lw)
-
-    def _draw_crosshair(self, x, y, arm, gap, line_width):
-        """Draw a crosshair (+) shape with centre gap."""
-        path = AppKit.NSBezierPath.bezierPath()
-        path.setLineWidth_(line_width)
-        path.setLineCapStyle_(AppKit.NSLineCapStyleRound)
-
-        # Top arm
-        path.moveToPoint_((x, y + gap))
-        path.lineToPoint_((x, y + arm))
-
-        # Bottom arm
-        path.moveToPoint_((x, y - gap))
-        path.lineToPoint_((x, y - arm))
-
-        # Right arm
-        path.moveToPoint_((x + gap, y))
-        path.lineToPoint_((x + arm, y))
-
-        # Left arm
-        path.moveToPoint_((x - gap, y))
-        path.lineToPoint_((x - arm, y))
+        # Hidden until the first gaze sample gives it a position and opacity
+        self._crosshair_layer.setOpacity_(0.0)
+        self.layer().addSublayer_(self._crosshair_layer)
+        return self
 
-        path.stroke()
+    @objc.python_method
+    def set_path(self, path):
+        """Use the CGPath path (centred on the origin) for both layers."""
+        self._shadow_layer.setPath_(path)
+        self._main_layer.setPath_(path)
+
+    @objc.python_method
+    def apply_style(self):
+        """Push the current colour and line width to the crosshair layers.
+
+        Call this and set_path inside a CATransaction with actions disabled,
+        or the layers animate to their new style.
+        """
+        if self._line_width != self._applied_line_width:
+            self._applied_line_width = self._line_width
+            self._shadow_layer.setLineWidth_(self._line_width + 1.5)
+            self._main_layer.setLineWidth_(self._line_width)
+        # Colour stays fully opaque (fading is the container's opacity), so it
+        # only needs a new CGColor when the user picks a different one
+        rgb = (self._color_r, self._color_g, self._color_b)
+        if rgb != self._stroke_rgb:
+            self._stroke_rgb = rgb
+            self._main_layer.setStrokeColor_(
+                NSColor.colorWithCalibratedRed_green_blue_alpha_(*rgb, 1.0).CGColor()
+            )
+
+    @objc.python_method
+    def set_gaze(self, x, y, opacity):
+        """Move the crosshair to screen point (x, y), top-left origin."""
+        Quartz.CATransaction.begin()
+        Quartz.CATransaction.setDisableActions_(True)
+        # The view is flipped, so gaze coordinates go in as they are
+        self._crosshair_layer.setPosition_((x, y))
+        self._crosshair_layer.setOpacity_(opacity)
+        Quartz.CATransaction.commit()
+
+    def isFlipped(self):
+        # Top-left origin like the gaze coordinates; AppKit flips the
+        # backing layer's geometry to match
+        return True
 
     def isOpaque(self):
         return False
@@ -91,16 +109,31 @@ class OverlayController:
         self.settings = settings
         self.visible = True
 
-        # Smoothing state
-        self._smoothed_x = 0.0
-        self._smoothed_y = 0.0
-        self._first_update = True
+        # Last raw sample that moved more than the jitter threshold
+        self._last_raw_x = 0.0
+        self._last_raw_y = 0.0
+
+        # Smoothing state; None until the first gaze sample seeds it
+        self._smoothed_x = None
+        self._smoothed_y = None
 
         # Face loss fade
         self._face_detected = True
         self._face_lost_time = 0.0
         self._target_opacity = 1.0
         self._current_opacity = 1.0
+        # (x, y, opacity) last handed to the view, rounded to what is visible
+        self._last_drawn = None
+
+        # Crosshair path and the (arm, gap) it was built for
+        self._crosshair_cgpath = None
+        self._crosshair_geometry = None
+
+        # Newest (x, y, opacity) waiting for the next display refresh.  The
+        # link runs only while updates keep arriving and stops on the first
+        # refresh with nothing to apply.
+        self._pending_gaze = None
+        self._display_link = DisplayLink(self._on_display_refresh)
 
         screen = NSScreen.mainScreen()
         self.screen_frame = screen.frame()
@@ -132,14 +165,51 @@ class OverlayController:
         self.window.setContentView_(self.view)
         self._apply_settings()
 
+    def _overlay_settings(self):
+        """The settings fields the crosshair's appearance depends on."""
+        s = self.settings
+        return (s.crosshair_color_r, s.crosshair_color_g, s.crosshair_color_b,
+                s.crosshair_size, s.crosshair_line_width, s.crosshair_gap)
+
     def _apply_settings(self):
         """Apply current settings to the crosshair view."""
+        self._applied_settings = self._overlay_settings()
+        # One transaction with actions off, so a slider drag lands as a
+        # single unanimated layer update per tick
+        Quartz.CATransaction.begin()
+        Quartz.CATransaction.setDisableActions_(True)
         self.view._color_r = self.settings.crosshair_color_r
         self.view._color_g = self.settings.crosshair_color_g
         self.view._color_b = self.settings.crosshair_color_b
-        self.view._arm_length = self.settings.crosshair_size
         self.view._line_width = self.settings.crosshair_line_width
-        self.view._gap = self.settings.crosshair_gap
+        self.view.apply_style()
+        self._rebuild_crosshair_path()
+        Quartz.CATransaction.commit()
+
+    def _rebuild_crosshair_path(self):
+        """Build the crosshair (+) path with centre gap for the current geometry.
+
+        Arm length and gap only change when the user edits them, so the path
+        is built once per edit, frozen, and shared by both layers; per frame
+        the layers are only moved.
+        """
+        geometry = (self.settings.crosshair_size, self.settings.crosshair_gap)
+        if geometry == self._crosshair_geometry:
+            return
+        self._crosshair_geometry = geometry
+        arm, gap = geometry
+
+        path = Quartz.CGPathCreateMutable()
+        for (x0, y0), (x1, y1) in (
+            ((0, gap), (0, arm)),      # Top arm
+            ((0, -gap), (0, -arm)),    # Bottom arm
+            ((gap, 0), (arm, 0)),      # Right arm
+            ((-gap, 0), (-arm, 0)),    # Left arm
+        ):
+            Quartz.CGPathMoveToPoint(path, None, x0, y0)
+            Quartz.CGPathAddLineToPoint(path, None, x1, y1)
+        self._crosshair_cgpath = Quartz.CGPathCreateCopy(path)
+        self.view.set_path(self._crosshair_cgpath)
 
     def show(self):
         """Show the overlay window."""
@@ -151,6 +221,11 @@ class OverlayController:
         """Hide the overlay window."""
         self.window.orderOut_(None)
         self.visible = False
+        self._display_link.stop()
+        # Keep the newest position for when the window comes back
+        if self._pending_gaze is not None:
+            self.view.set_gaze(*self._pending_gaze)
+            self._pending_gaze = None
 
     def toggle(self):
         """Toggle overlay visibility."""
@@ -162,23 +237,18 @@ class OverlayController:
     def update_gaze(self, raw_x, raw_y, face_detected, confidence):
         """Update the crosshair position with smoothing and face-loss handling."""
         now = time.time()
-        alpha = self.settings.smoothing_alpha
 
         if face_detected:
-            # Clamp to screen bounds
-            raw_x = max(0, min(raw_x, self.screen_width))
-            raw_y = max(0, min(raw_y, self.screen_height))
-
-            if self._first_update:
-                self._smoothed_x = raw_x
-                self._smoothed_y = raw_y
-                self._first_update = False
-            else:
-                self._smoothed_x = alpha * raw_x + (1 - alpha) * self._smoothed_x
-                self._smoothed_y = alpha * raw_y + (1 - alpha) * self._smoothed_y
-
-            self.view._gaze_x = self._smoothed_x
-            self.view._gaze_y = self._smoothed_y
+            # Clamp to the screen, snap samples within a couple of pixels of
+            # the last one onto it, then smooth
+            seed = self._smoothed_x is None
+            (self._last_raw_x, self._last_raw_y,
+             self._smoothed_x, self._smoothed_y) = smooth_gaze(
+                float(raw_x), float(raw_y), self._last_raw_x, self._last_raw_y,
+                0.0 if seed else self._smoothed_x, 0.0 if seed else self._smoothed_y,
+                seed, self.settings.smoothing_alpha,
+                self.screen_width, self.screen_height, JITTER_EPS_SQ,
+            )
 
             if not self._face_detected:
                 # Face re-detected - fade in over 0.3s
@@ -199,14 +269,39 @@ class OverlayController:
 
         # Smooth opacity changes
         opacity_speed = 0.15  # lerp speed
-        self._current_opacity += (self._target_opacity - self._current_opacity) * opacity_speed
-        self.view._opacity = max(0, min(1, self._current_opacity))
+        self._current_opacity, opacity = step_opacity(
+            self._current_opacity, self._target_opacity, opacity_speed
+        )
 
-        if self.visible:
-            self.view.setNeedsDisplay_(True)
+        if self._smoothed_x is None:
+            # No gaze sample yet, so nowhere to put the crosshair; the layer
+            # starts out transparent, so there is nothing to fade either
+            return
+
+        # Skip the layer update if nothing visible changed (a fixating user)
+        drawn = (round(self._smoothed_x), round(self._smoothed_y), round(opacity, 2))
+        if drawn == self._last_drawn:
+            return
+        self._last_drawn = drawn
+
+        # Applied on the next vsync; several updates within one refresh
+        # interval collapse into the last
+        self._pending_gaze = (self._smoothed_x, self._smoothed_y, opacity)
+        if not self._display_link.start():
+            self._on_display_refresh()
+
+    def _on_display_refresh(self):
+        """Push the newest gaze state to the view, once per display refresh."""
+        if self._pending_gaze is None:
+            self._display_link.stop()
+            return
+        self.view.set_gaze(*self._pending_gaze)
+        self._pending_gaze = None
 
     def update_settings(self, settings):
         """Update appearance from settings."""
         self.settings = settings
+        # Nothing to do for changes the crosshair doesn't draw with
+        if self._overlay_settings() == self._applied_settings:
+            return
         self._apply_settings()
-        self.view.setNeedsDisplay_(True)
@@ -2,7 +2,8 @@
 
 import os
 import plistlib
-from dataclasses import dataclass, field, asdict
+import tempfile
+from dataclasses import dataclass, field
 
 PLIST_PATH = os.path.expanduser("~/Library/Preferences/com.gazetracker.plist")
 
@@ -27,6 +28,8 @@ class Settings:
     camera_resolution_w: int = 640
     camera_resolution_h: int = 480
     camera_fps: int = 30
+    frame_diff_threshold: float = 1.5  # skip inference below this mean grey-level change; 0 disables
+    max_inference_ms: float = 33.0  # above this average latency, every other frame skips inference; 0 disables
     auto_recalibrate_prompt: bool = True
     confidence_panel_x: float = 50.0
     confidence_panel_y: float = 50.0
@@ -34,23 +37,38 @@ class Settings:
     webcam_preview_y: float = 100.0
 
     def save(self):
-        data = asdict(self)
+        # Every field is a flat scalar, so a shallow dict is all plistlib needs;
+        # asdict() would deep-copy each value on every save
+        data = dict(vars(self))
+        # Write a sibling temp file and rename it over the plist, so a crash
+        # mid-write can't leave a truncated file behind
+        tmp_path = None
         try:
-            with open(PLIST_PATH, "wb") as f:
-                plistlib.dump(data, f)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(PLIST_PATH), prefix=".plist.tmp"
+            )
+            with os.fdopen(fd, "wb") as f:
+                plistlib.dump(data, f, fmt=plistlib.FMT_BINARY)
+            os.replace(tmp_path, PLIST_PATH)
         except Exception as e:
             print(f"Failed to save settings: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     @classmethod
     def load(cls) -> "Settings":
         if not os.path.exists(PLIST_PATH):
             return cls()
         try:
+            # Format is auto-detected, so XML plists from older versions still load
             with open(PLIST_PATH, "rb") as f:
                 data = plistlib.load(f)
-            known_fields = {f.name for f in cls.__dataclass_fields__.values()}
-            filtered = {k: v for k, v in data.items() if k in known_fields}
+            filtered = {k: v for k, v in data.items() if k in cls._KNOWN_FIELDS}
             return cls(**filtered)
         except Exception as e:
             print(f"Failed to load settings, using defaults: {e}")
             return cls()
+
+
+# Field names accepted by Settings.load; keys from other versions are dropped
+Settings._KNOWN_FIELDS = frozenset(Settings.__dataclass_fields__)
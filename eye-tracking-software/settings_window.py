@@ -2,14 +2,16 @@
 
 import objc
 import AppKit
-from Foundation import NSObject, NSMakeRect, NSMakeSize
+from Foundation import (
+    NSObject, NSMakeRect, NSTimer, NSRunLoop, NSRunLoopCommonModes,
+)
 from AppKit import (
-    NSWindow, NSView, NSColor, NSFont, NSScreen,
+    NSWindow, NSColor, NSFont, NSScreen,
     NSWindowStyleMaskTitled, NSWindowStyleMaskClosable,
     NSBackingStoreBuffered, NSTextField, NSSlider,
-    NSButton, NSColorWell, NSSwitchButton, NSPopUpButton,
+    NSButton, NSColorWell, NSColorPanel, NSSwitchButton, NSPopUpButton,
     NSFloatingWindowLevel, NSScrollView, NSBox,
-    NSBoxSeparator,
+    NSBoxSeparator, NSStackView, NSUserInterfaceLayoutOrientationVertical,
 )
 import AVFoundation
 
@@ -39,6 +41,25 @@ def _enumerate_cameras():
     return [(i, str(d.localizedName())) for i, d in enumerate(devices)]
 
 
+# Result of the last _enumerate_cameras() call; None means enumerate again.
+# Discovery can block for tens of ms, so it only reruns on Refresh or when a
+# device is connected or disconnected.
+_CAM_CACHE = None
+
+
+def _cached_cameras():
+    """Return the cached camera list, enumerating if it has been invalidated."""
+    global _CAM_CACHE
+    if _CAM_CACHE is None:
+        _CAM_CACHE = _enumerate_cameras()
+    return _CAM_CACHE
+
+
+def _invalidate_camera_cache(notification=None):
+    global _CAM_CACHE
+    _CAM_CACHE = None
+
+
 # Resolution and FPS presets
 _RESOLUTION_PRESETS = [
     (640, 480, "640 × 480"),
@@ -48,6 +69,26 @@ _RESOLUTION_PRESETS = [
 
 _FPS_PRESETS = [15, 30, 60]
 
+# Layout metrics
+_PAD_X = 24
+_LABEL_W = 160
+_CONTROL_W = 180
+_SECTION_SPACING = 20
+
+# "%dpx" labels for the integer sliders, formatted once per value
+_PX_LABELS = {}
+
+
+def _px_label(val):
+    label = _PX_LABELS.get(val)
+    if label is None:
+        label = _PX_LABELS[val] = "%dpx" % val
+    return label
+
+
+# Seconds a slider has to rest before its change is saved and announced
+NOTIFY_DELAY = 0.2
+
 
 class SettingsWindowController:
     """Native macOS settings/preferences window with sectioned layout."""
@@ -56,6 +97,19 @@ class SettingsWindowController:
         self.settings = settings
         self.on_settings_changed = on_settings_changed
         self._cameras = []
+        self._pending_notify_timer = None
+        # Field values as of the last notification, to work out what changed
+        self._snapshot = dict(vars(settings))
+        center = AppKit.NSNotificationCenter.defaultCenter()
+        self._device_observers = [
+            center.addObserverForName_object_queue_usingBlock_(
+                name, None, None, _invalidate_camera_cache
+            )
+            for name in (
+                AVFoundation.AVCaptureDeviceWasConnectedNotification,
+                AVFoundation.AVCaptureDeviceWasDisconnectedNotification,
+            )
+        ]
         self._setup_window()
 
     # ------------------------------------------------------------------
@@ -86,46 +140,37 @@ class SettingsWindowController:
         scroll.setHasVerticalScrollbar_(True)
         scroll.setAutohidesScrollers_(True)
 
-        # Inner document view — tall enough for all sections
-        content_h = 680
-        content = NSView.alloc().initWithFrame_(
-            NSMakeRect(0, 0, win_w, content_h)
-        )
-        content.setFlipped_(True)
-
-        pad_x = 24
-        label_w = 160
-        ctrl_x = pad_x + label_w + 8
-        ctrl_w = 180
-        y_pos = 16  # flipped: top = small number
+        # Content is one vertical stack of sections and label/control rows;
+        # Auto Layout works out every frame in a single pass
+        content = NSStackView.alloc().initWithFrame_(NSMakeRect(0, 0, win_w, win_h))
+        content.setOrientation_(NSUserInterfaceLayoutOrientationVertical)
+        content.setAlignment_(AppKit.NSLayoutAttributeLeading)
+        content.setSpacing_(12)
+        content.setEdgeInsets_((16, _PAD_X, 16, _PAD_X))
 
         # ========== Section 1: Camera ==========
-        y_pos = self._add_section_header(content, "Camera", pad_x, y_pos)
+        self._add_section_header(content, "Camera")
 
         # Camera Device
-        y_pos = self._add_label(content, "Camera Device:", pad_x, y_pos)
         self._camera_popup = NSPopUpButton.alloc().initWithFrame_pullsDown_(
-            NSMakeRect(ctrl_x, y_pos - 2, ctrl_w, 24), False
-        )
-        content.addSubview_(self._camera_popup)
-        self._refresh_btn = NSButton.alloc().initWithFrame_(
-            NSMakeRect(ctrl_x + ctrl_w + 6, y_pos - 2, 70, 24)
+            NSMakeRect(0, 0, _CONTROL_W, 24), False
         )
+        self._set_width(self._camera_popup, _CONTROL_W)
+        self._refresh_btn = NSButton.alloc().initWithFrame_(NSMakeRect(0, 0, 70, 24))
         self._refresh_btn.setTitle_("Refresh")
         self._refresh_btn.setBezelStyle_(AppKit.NSBezelStyleRounded)
         self._refresh_btn.setTarget_(self)
         self._refresh_btn.setAction_(objc.selector(self._on_refresh_cameras, signature=b"v@:@"))
-        content.addSubview_(self._refresh_btn)
         self._populate_camera_popup()
         self._camera_popup.setTarget_(self)
         self._camera_popup.setAction_(objc.selector(self._on_camera_changed, signature=b"v@:@"))
-        y_pos += 34
+        self._add_row(content, "Camera Device:", self._camera_popup, self._refresh_btn)
 
         # Resolution
-        y_pos = self._add_label(content, "Resolution:", pad_x, y_pos)
         self._resolution_popup = NSPopUpButton.alloc().initWithFrame_pullsDown_(
-            NSMakeRect(ctrl_x, y_pos - 2, ctrl_w, 24), False
+            NSMakeRect(0, 0, _CONTROL_W, 24), False
         )
+        self._set_width(self._resolution_popup, _CONTROL_W)
         for w, h, title in _RESOLUTION_PRESETS:
             self._resolution_popup.addItemWithTitle_(title)
         # Select current
@@ -136,14 +181,13 @@ class SettingsWindowController:
                 break
         self._resolution_popup.setTarget_(self)
         self._resolution_popup.setAction_(objc.selector(self._on_resolution_changed, signature=b"v@:@"))
-        content.addSubview_(self._resolution_popup)
-        y_pos += 34
+        self._add_row(content, "Resolution:", self._resolution_popup)
 
         # Frame Rate
-        y_pos = self._add_label(content, "Frame Rate:", pad_x, y_pos)
         self._fps_popup = NSPopUpButton.alloc().initWithFrame_pullsDown_(
-            NSMakeRect(ctrl_x, y_pos - 2, ctrl_w, 24), False
+            NSMakeRect(0, 0, _CONTROL_W, 24), False
         )
+        self._set_width(self._fps_popup, _CONTROL_W)
         for fps in _FPS_PRESETS:
             self._fps_popup.addItemWithTitle_(f"{fps} fps")
         cur_fps = self.settings.camera_fps
@@ -153,61 +197,43 @@ class SettingsWindowController:
                 break
         self._fps_popup.setTarget_(self)
         self._fps_popup.setAction_(objc.selector(self._on_fps_changed, signature=b"v@:@"))
-        content.addSubview_(self._fps_popup)
-        y_pos += 40
+        row = self._add_row(content, "Frame Rate:", self._fps_popup)
+        content.setCustomSpacing_afterView_(_SECTION_SPACING, row)
 
         # ========== Section 2: Tracking ==========
-        y_pos = self._add_section_header(content, "Tracking", pad_x, y_pos)
+        self._add_section_header(content, "Tracking")
 
         # Smoothing
-        y_pos = self._add_label(content, "Smoothing:", pad_x, y_pos)
-        self._smooth_slider = NSSlider.alloc().initWithFrame_(
-            NSMakeRect(ctrl_x, y_pos, ctrl_w, 20)
-        )
-        self._smooth_slider.setMinValue_(0.05)
-        self._smooth_slider.setMaxValue_(0.95)
-        self._smooth_slider.setFloatValue_(self.settings.smoothing_alpha)
-        self._smooth_slider.setTarget_(self)
-        self._smooth_slider.setAction_(objc.selector(self._on_smooth_changed, signature=b"v@:@"))
-        content.addSubview_(self._smooth_slider)
-        self._smooth_label = self._add_value_label(
-            content, f"{self.settings.smoothing_alpha:.2f}", ctrl_x + ctrl_w + 8, y_pos
+        self._smooth_slider, self._smooth_label = self._make_slider(
+            0.05, 0.95, self.settings.smoothing_alpha,
+            self._on_smooth_changed, "%.2f" % self.settings.smoothing_alpha,
         )
-        y_pos += 30
+        row = self._add_row(content, "Smoothing:", self._smooth_slider, self._smooth_label)
+        content.setCustomSpacing_afterView_(4, row)
 
         # Smoothing hint
-        hint = NSTextField.alloc().initWithFrame_(NSMakeRect(ctrl_x, y_pos, ctrl_w + 80, 16))
-        hint.setStringValue_("Lower = smoother, higher = more reactive")
-        hint.setEditable_(False)
-        hint.setBezeled_(False)
-        hint.setDrawsBackground_(False)
+        hint = self._make_label("Lower = smoother, higher = more reactive", NSFont.systemFontOfSize_(10))
         hint.setTextColor_(NSColor.secondaryLabelColor())
-        hint.setFont_(NSFont.systemFontOfSize_(10))
-        content.addSubview_(hint)
-        y_pos += 24
+        self._add_row(content, "", hint)
 
         # Auto-recalibrate prompt
-        y_pos = self._add_label(content, "Auto-recalibrate:", pad_x, y_pos)
-        self._auto_recal_toggle = NSButton.alloc().initWithFrame_(
-            NSMakeRect(ctrl_x, y_pos - 2, 200, 20)
-        )
+        self._auto_recal_toggle = NSButton.alloc().initWithFrame_(NSMakeRect(0, 0, 200, 20))
         self._auto_recal_toggle.setButtonType_(NSSwitchButton)
         self._auto_recal_toggle.setTitle_("Prompt when confidence low")
         self._auto_recal_toggle.setFont_(NSFont.systemFontOfSize_(11))
         self._auto_recal_toggle.setState_(1 if self.settings.auto_recalibrate_prompt else 0)
         self._auto_recal_toggle.setTarget_(self)
         self._auto_recal_toggle.setAction_(objc.selector(self._on_auto_recal_toggled, signature=b"v@:@"))
-        content.addSubview_(self._auto_recal_toggle)
-        y_pos += 40
+        row = self._add_row(content, "Auto-recalibrate:", self._auto_recal_toggle)
+        content.setCustomSpacing_afterView_(_SECTION_SPACING, row)
 
         # ========== Section 3: Crosshair ==========
-        y_pos = self._add_section_header(content, "Crosshair", pad_x, y_pos)
+        self._add_section_header(content, "Crosshair")
 
         # Colour
-        y_pos = self._add_label(content, "Colour:", pad_x, y_pos)
-        self._color_well = NSColorWell.alloc().initWithFrame_(
-            NSMakeRect(ctrl_x, y_pos - 2, 44, 24)
-        )
+        self._color_well = NSColorWell.alloc().initWithFrame_(NSMakeRect(0, 0, 44, 24))
+        self._set_width(self._color_well, 44)
+        self._color_well.heightAnchor().constraintEqualToConstant_(24).setActive_(True)
         self._color_well.setColor_(
             NSColor.colorWithCalibratedRed_green_blue_alpha_(
                 self.settings.crosshair_color_r,
@@ -218,154 +244,135 @@ class SettingsWindowController:
         )
         self._color_well.setTarget_(self)
         self._color_well.setAction_(objc.selector(self._on_color_changed, signature=b"v@:@"))
-        content.addSubview_(self._color_well)
-        y_pos += 34
+        # Send the colour once the user lets go in the picker, not on every drag
+        NSColorPanel.sharedColorPanel().setContinuous_(False)
+        self._add_row(content, "Colour:", self._color_well)
 
         # Size
-        y_pos = self._add_label(content, "Size:", pad_x, y_pos)
-        self._size_slider = NSSlider.alloc().initWithFrame_(
-            NSMakeRect(ctrl_x, y_pos, ctrl_w, 20)
-        )
-        self._size_slider.setMinValue_(10)
-        self._size_slider.setMaxValue_(80)
-        self._size_slider.setIntValue_(self.settings.crosshair_size)
-        self._size_slider.setTarget_(self)
-        self._size_slider.setAction_(objc.selector(self._on_size_changed, signature=b"v@:@"))
-        content.addSubview_(self._size_slider)
-        self._size_label = self._add_value_label(
-            content, f"{self.settings.crosshair_size}px", ctrl_x + ctrl_w + 8, y_pos
+        self._size_slider, self._size_label = self._make_slider(
+            10, 80, self.settings.crosshair_size,
+            self._on_size_changed, _px_label(self.settings.crosshair_size),
         )
-        y_pos += 30
+        self._add_row(content, "Size:", self._size_slider, self._size_label)
 
         # Line Width
-        y_pos = self._add_label(content, "Line Width:", pad_x, y_pos)
-        self._line_width_slider = NSSlider.alloc().initWithFrame_(
-            NSMakeRect(ctrl_x, y_pos, ctrl_w, 20)
+        self._line_width_slider, self._line_width_label = self._make_slider(
+            0.5, 4.0, self.settings.crosshair_line_width,
+            self._on_line_width_changed, "%.1f" % self.settings.crosshair_line_width,
         )
-        self._line_width_slider.setMinValue_(0.5)
-        self._line_width_slider.setMaxValue_(4.0)
-        self._line_width_slider.setFloatValue_(self.settings.crosshair_line_width)
-        self._line_width_slider.setTarget_(self)
-        self._line_width_slider.setAction_(objc.selector(self._on_line_width_changed, signature=b"v@:@"))
-        content.addSubview_(self._line_width_slider)
-        self._line_width_label = self._add_value_label(
-            content, f"{self.settings.crosshair_line_width:.1f}", ctrl_x + ctrl_w + 8, y_pos
-        )
-        y_pos += 30
+        self._add_row(content, "Line Width:", self._line_width_slider, self._line_width_label)
 
         # Centre Gap
-        y_pos = self._add_label(content, "Centre Gap:", pad_x, y_pos)
-        self._gap_slider = NSSlider.alloc().initWithFrame_(
-            NSMakeRect(ctrl_x, y_pos, ctrl_w, 20)
-        )
-        self._gap_slider.setMinValue_(0)
-        self._gap_slider.setMaxValue_(20)
-        self._gap_slider.setIntValue_(self.settings.crosshair_gap)
-        self._gap_slider.setTarget_(self)
-        self._gap_slider.setAction_(objc.selector(self._on_gap_changed, signature=b"v@:@"))
-        content.addSubview_(self._gap_slider)
-        self._gap_label = self._add_value_label(
-            content, f"{self.settings.crosshair_gap}px", ctrl_x + ctrl_w + 8, y_pos
+        self._gap_slider, self._gap_label = self._make_slider(
+            0, 20, self.settings.crosshair_gap,
+            self._on_gap_changed, _px_label(self.settings.crosshair_gap),
         )
-        y_pos += 40
+        row = self._add_row(content, "Centre Gap:", self._gap_slider, self._gap_label)
+        content.setCustomSpacing_afterView_(_SECTION_SPACING, row)
 
         # ========== Section 4: Display ==========
-        y_pos = self._add_section_header(content, "Display", pad_x, y_pos)
+        self._add_section_header(content, "Display")
 
         # Show Webcam Preview
-        y_pos = self._add_label(content, "Webcam Preview:", pad_x, y_pos)
-        self._webcam_toggle = NSButton.alloc().initWithFrame_(
-            NSMakeRect(ctrl_x, y_pos - 2, 40, 20)
-        )
+        self._webcam_toggle = NSButton.alloc().initWithFrame_(NSMakeRect(0, 0, 40, 20))
         self._webcam_toggle.setButtonType_(NSSwitchButton)
         self._webcam_toggle.setTitle_("")
         self._webcam_toggle.setState_(1 if self.settings.show_webcam_preview else 0)
         self._webcam_toggle.setTarget_(self)
         self._webcam_toggle.setAction_(objc.selector(self._on_webcam_toggled, signature=b"v@:@"))
-        content.addSubview_(self._webcam_toggle)
-        y_pos += 30
+        self._add_row(content, "Webcam Preview:", self._webcam_toggle)
 
         # Show FPS
-        y_pos = self._add_label(content, "Show FPS in Panel:", pad_x, y_pos)
-        self._fps_toggle = NSButton.alloc().initWithFrame_(
-            NSMakeRect(ctrl_x, y_pos - 2, 40, 20)
-        )
+        self._fps_toggle = NSButton.alloc().initWithFrame_(NSMakeRect(0, 0, 40, 20))
         self._fps_toggle.setButtonType_(NSSwitchButton)
         self._fps_toggle.setTitle_("")
         self._fps_toggle.setState_(1 if self.settings.show_fps else 0)
         self._fps_toggle.setTarget_(self)
         self._fps_toggle.setAction_(objc.selector(self._on_fps_toggled, signature=b"v@:@"))
-        content.addSubview_(self._fps_toggle)
-        y_pos += 30
+        self._add_row(content, "Show FPS in Panel:", self._fps_toggle)
 
         # Show/Hide Hotkey (read-only)
-        y_pos = self._add_label(content, "Show/Hide Hotkey:", pad_x, y_pos)
-        self._hotkey_field = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(ctrl_x, y_pos - 2, ctrl_w, 24)
-        )
+        self._hotkey_field = NSTextField.alloc().initWithFrame_(NSMakeRect(0, 0, _CONTROL_W, 24))
+        self._set_width(self._hotkey_field, _CONTROL_W)
         self._hotkey_field.setStringValue_(self.settings.hotkey_display)
         self._hotkey_field.setEditable_(False)
         self._hotkey_field.setBezeled_(True)
         self._hotkey_field.setAlignment_(AppKit.NSTextAlignmentCenter)
-        content.addSubview_(self._hotkey_field)
-        y_pos += 40
+        self._add_row(content, "Show/Hide Hotkey:", self._hotkey_field)
 
-        # Resize document view to fit content
-        content.setFrameSize_(NSMakeSize(win_w, max(y_pos + 16, win_h)))
+        # Pin the stack to the top and sides of the scroll view; its height
+        # follows from the rows, and anything taller than the window scrolls
         scroll.setDocumentView_(content)
+        content.setTranslatesAutoresizingMaskIntoConstraints_(False)
+        clip = scroll.contentView()
+        for anchor in ("topAnchor", "leadingAnchor", "trailingAnchor"):
+            getattr(content, anchor)().constraintEqualToAnchor_(
+                getattr(clip, anchor)()
+            ).setActive_(True)
         self.window.setContentView_(scroll)
 
     # ------------------------------------------------------------------
     # Helpers — layout
     # ------------------------------------------------------------------
 
-    def _add_section_header(self, parent, title, x, y):
-        """Add a bold section header + separator line. Returns updated y."""
-        label = NSTextField.alloc().initWithFrame_(NSMakeRect(x, y, 300, 20))
-        label.setStringValue_(title)
-        label.setEditable_(False)
-        label.setBezeled_(False)
-        label.setDrawsBackground_(False)
-        label.setFont_(NSFont.boldSystemFontOfSize_(13))
-        parent.addSubview_(label)
-        y += 22
+    def _add_section_header(self, stack, title):
+        """Add a bold section header + separator line to stack."""
+        label = self._make_label(title, NSFont.boldSystemFontOfSize_(13))
+        stack.addArrangedSubview_(label)
+        stack.setCustomSpacing_afterView_(2, label)
 
-        sep = NSBox.alloc().initWithFrame_(NSMakeRect(x, y, 432, 1))
+        sep = NSBox.alloc().initWithFrame_(NSMakeRect(0, 0, 432, 1))
         sep.setBoxType_(NSBoxSeparator)
-        parent.addSubview_(sep)
-        y += 10
-        return y
-
-    def _add_label(self, parent, text, x, y):
-        """Add a standard label at (x, y). Returns y unchanged."""
-        label = NSTextField.alloc().initWithFrame_(NSMakeRect(x, y, 160, 20))
+        stack.addArrangedSubview_(sep)
+        sep.widthAnchor().constraintEqualToAnchor_constant_(
+            stack.widthAnchor(), -2 * _PAD_X
+        ).setActive_(True)
+
+    def _add_row(self, stack, text, *controls):
+        """Add a row of a fixed-width label and its controls. Returns the row."""
+        label = self._make_label(text, NSFont.systemFontOfSize_(13))
+        self._set_width(label, _LABEL_W)
+        row = NSStackView.stackViewWithViews_([label, *controls])
+        row.setSpacing_(8)
+        stack.addArrangedSubview_(row)
+        return row
+
+    def _make_label(self, text, font):
+        """Create a non-editable, borderless text label."""
+        label = NSTextField.alloc().initWithFrame_(NSMakeRect(0, 0, 160, 20))
         label.setStringValue_(text)
         label.setEditable_(False)
         label.setBezeled_(False)
         label.setDrawsBackground_(False)
-        label.setFont_(NSFont.systemFontOfSize_(13))
-        parent.addSubview_(label)
-        return y
+        label.setFont_(font)
+        return label
 
-    def _add_value_label(self, parent, text, x, y):
-        """Small value label next to sliders."""
-        label = NSTextField.alloc().initWithFrame_(NSMakeRect(x, y, 50, 20))
-        label.setStringValue_(text)
-        label.setEditable_(False)
-        label.setBezeled_(False)
-        label.setDrawsBackground_(False)
-        label.setFont_(NSFont.systemFontOfSize_(11))
+    def _make_slider(self, min_value, max_value, value, action, text):
+        """Create a slider and its value label. Returns (slider, label)."""
+        slider = NSSlider.alloc().initWithFrame_(NSMakeRect(0, 0, _CONTROL_W, 20))
+        self._set_width(slider, _CONTROL_W)
+        slider.setMinValue_(min_value)
+        slider.setMaxValue_(max_value)
+        slider.setDoubleValue_(value)
+        slider.setTarget_(self)
+        slider.setAction_(objc.selector(action, signature=b"v@:@"))
+
+        # Small value label next to the slider
+        label = self._make_label(text, NSFont.systemFontOfSize_(11))
         label.setTextColor_(NSColor.secondaryLabelColor())
-        parent.addSubview_(label)
-        return label
+        self._set_width(label, 50)
+        return slider, label
+
+    def _set_width(self, view, width):
+        view.widthAnchor().constraintEqualToConstant_(width).setActive_(True)
 
     # ------------------------------------------------------------------
     # Camera enumeration
     # ------------------------------------------------------------------
 
     def _populate_camera_popup(self):
-        """Enumerate cameras and populate the popup button."""
-        self._cameras = _enumerate_cameras()
+        """Populate the popup button from the (cached) camera list."""
+        self._cameras = _cached_cameras()
         self._camera_popup.removeAllItems()
 
         if not self._cameras:
@@ -388,6 +395,7 @@ class SettingsWindowController:
     # ------------------------------------------------------------------
 
     def _on_refresh_cameras(self, sender):
+        _invalidate_camera_cache()
         self._populate_camera_popup()
 
     def _on_camera_changed(self, sender):
@@ -418,12 +426,17 @@ class SettingsWindowController:
 
     def _on_smooth_changed(self, sender):
         val = round(self._smooth_slider.floatValue(), 2)
+        if val == self.settings.smoothing_alpha:
+            return
         self.settings.smoothing_alpha = val
-        self._smooth_label.setStringValue_(f"{val:.2f}")
-        self._notify()
+        self._smooth_label.setStringValue_("%.2f" % val)
+        self._schedule_notify()
 
     def _on_auto_recal_toggled(self, sender):
-        self.settings.auto_recalibrate_prompt = bool(self._auto_recal_toggle.state())
+        val = bool(self._auto_recal_toggle.state())
+        if val == self.settings.auto_recalibrate_prompt:
+            return
+        self.settings.auto_recalibrate_prompt = val
         self._notify()
 
     # ------------------------------------------------------------------
@@ -432,50 +445,100 @@ class SettingsWindowController:
 
     def _on_color_changed(self, sender):
         color = self._color_well.color()
-        self.settings.crosshair_color_r = color.redComponent()
-        self.settings.crosshair_color_g = color.greenComponent()
-        self.settings.crosshair_color_b = color.blueComponent()
-        self.settings.crosshair_color_a = color.alphaComponent()
+        rgba = (color.redComponent(), color.greenComponent(),
+                color.blueComponent(), color.alphaComponent())
+        s = self.settings
+        if rgba == (s.crosshair_color_r, s.crosshair_color_g,
+                    s.crosshair_color_b, s.crosshair_color_a):
+            return
+        (s.crosshair_color_r, s.crosshair_color_g,
+         s.crosshair_color_b, s.crosshair_color_a) = rgba
         self._notify()
 
     def _on_size_changed(self, sender):
         val = int(self._size_slider.intValue())
+        if val == self.settings.crosshair_size:
+            return
         self.settings.crosshair_size = val
-        self._size_label.setStringValue_(f"{val}px")
-        self._notify()
+        self._size_label.setStringValue_(_px_label(val))
+        self._schedule_notify()
 
     def _on_line_width_changed(self, sender):
         val = round(self._line_width_slider.floatValue(), 1)
+        if val == self.settings.crosshair_line_width:
+            return
         self.settings.crosshair_line_width = val
-        self._line_width_label.setStringValue_(f"{val:.1f}")
-        self._notify()
+        self._line_width_label.setStringValue_("%.1f" % val)
+        self._schedule_notify()
 
     def _on_gap_changed(self, sender):
         val = int(self._gap_slider.intValue())
+        if val == self.settings.crosshair_gap:
+            return
         self.settings.crosshair_gap = val
-        self._gap_label.setStringValue_(f"{val}px")
-        self._notify()
+        self._gap_label.setStringValue_(_px_label(val))
+        self._schedule_notify()
 
     # ------------------------------------------------------------------
     # Callbacks — Display section
     # ------------------------------------------------------------------
 
     def _on_webcam_toggled(self, sender):
-        self.settings.show_webcam_preview = bool(self._webcam_toggle.state())
+        val = bool(self._webcam_toggle.state())
+        if val == self.settings.show_webcam_preview:
+            return
+        self.settings.show_webcam_preview = val
         self._notify()
 
     def _on_fps_toggled(self, sender):
-        self.settings.show_fps = bool(self._fps_toggle.state())
+        val = bool(self._fps_toggle.state())
+        if val == self.settings.show_fps:
+            return
+        self.settings.show_fps = val
         self._notify()
 
     # ------------------------------------------------------------------
     # Notify & window control
     # ------------------------------------------------------------------
 
+    def _schedule_notify(self):
+        """Save and announce a slider change once the slider rests.
+
+        The value label updates on every tick; the disk write and the
+        settings callback wait until NOTIFY_DELAY passes with no further
+        change.  The timer runs in the common modes so it also fires while
+        the mouse is still down on the slider.
+        """
+        if self._pending_notify_timer:
+            self._pending_notify_timer.invalidate()
+        self._pending_notify_timer = NSTimer.timerWithTimeInterval_target_selector_userInfo_repeats_(
+            NOTIFY_DELAY, self, "flushSave:", None, False
+        )
+        NSRunLoop.currentRunLoop().addTimer_forMode_(
+            self._pending_notify_timer, NSRunLoopCommonModes
+        )
+
+    def flushSave_(self, timer):
+        self._pending_notify_timer = None
+        self._notify()
+
     def _notify(self):
+        """Save and announce the current settings now (discrete controls)."""
+        if self._pending_notify_timer:
+            # Anything a slider had pending goes out with this change
+            self._pending_notify_timer.invalidate()
+            self._pending_notify_timer = None
+
+        # The settings object is edited in place, so diff against a snapshot
+        current = vars(self.settings)
+        changed_keys = {k for k, v in current.items() if self._snapshot.get(k) != v}
+        if not changed_keys:
+            return
+        self._snapshot = dict(current)
+
         self.settings.save()
         if self.on_settings_changed:
-            self.on_settings_changed(self.settings)
+            self.on_settings_changed(self.settings, changed_keys)
 
     def show(self):
         self.window.makeKeyAndOrderFront_(None)
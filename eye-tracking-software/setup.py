@@ -9,16 +9,23 @@ OPTIONS = {
     'iconfile': 'AppIcon.icns',
     'plist': 'Info.plist',
     'packages': [
-        'cv2', 'mediapipe', 'sklearn', 'numpy',
+        'cv2', 'mediapipe', 'numpy', 'numba', 'llvmlite',
+        # Only the sklearn subpackages gaze_estimator uses, not the whole tree
+        'sklearn.linear_model', 'sklearn.preprocessing', 'sklearn.pipeline',
+        'sklearn.model_selection', 'sklearn.gaussian_process', 'sklearn.multioutput',
         'objc', 'AppKit', 'Foundation', 'Quartz', 'AVFoundation',
-        'pynput',
     ],
     'includes': [
         'settings', 'gaze_estimator', 'calibration',
         'overlay', 'confidence_panel', 'settings_window',
-        'webcam_preview',
+        'webcam_preview', 'frame_grabber', 'display_link',
+        'inference_worker', 'gaze_kernels', 'smoothing',
+    ],
+    'excludes': [
+        'tkinter', 'matplotlib', 'scipy.spatial.cKDTree',
+        'sklearn.tests', 'sklearn.datasets', 'numpy.tests',
+        'mediapipe.model_maker',
     ],
-    'excludes': ['tkinter', 'matplotlib', 'scipy.spatial.cKDTree'],
     'site_packages': True,
 }
 
@@ -0,0 +1,46 @@
+"""Compiled per-frame crosshair smoothing math.
+
+Uses the same optional numba decorator as gaze_kernels, so without numba
+these run as plain Python.
+"""
+
+from gaze_kernels import NJIT_CACHE, njit
+
+
+@njit(cache=NJIT_CACHE)
+def smooth_gaze(raw_x, raw_y, last_x, last_y, sx, sy, seed, alpha, sw, sh, eps_sq):
+    """Clamp, de-jitter and exponentially smooth one gaze sample.
+
+    (last_x, last_y) is the last sample that moved more than sqrt(eps_sq)
+    pixels; closer samples are snapped onto it.  (sx, sy) is the smoothed
+    position, ignored when seed is True (the first sample is taken as is).
+    sw and sh are the screen size the sample is clamped to.
+
+    Returns (last_x, last_y, sx, sy).
+    """
+    raw_x = 0.0 if raw_x < 0.0 else sw if raw_x > sw else raw_x
+    raw_y = 0.0 if raw_y < 0.0 else sh if raw_y > sh else raw_y
+
+    dx = raw_x - last_x
+    dy = raw_y - last_y
+    if dx * dx + dy * dy < eps_sq:
+        raw_x = last_x
+        raw_y = last_y
+
+    if seed:
+        return raw_x, raw_y, raw_x, raw_y
+    one_minus_alpha = 1.0 - alpha
+    return (raw_x, raw_y,
+            alpha * raw_x + one_minus_alpha * sx,
+            alpha * raw_y + one_minus_alpha * sy)
+
+
+@njit(cache=NJIT_CACHE)
+def step_opacity(current, target, speed):
+    """Move current towards target by speed.
+
+    Returns (current, opacity): the new unclamped value and the same clamped
+    to [0, 1] for display.
+    """
+    current += (target - current) * speed
+    return current, 0.0 if current < 0.0 else 1.0 if current > 1.0 else current
@@ -0,0 +1,22 @@
+"""Tests for the crosshair overlay's face-loss fade (macOS only)."""
+
+import pytest
+
+AppKit = pytest.importorskip("AppKit")
+
+import overlay
+from settings import Settings
+
+
+def test_no_face_from_start_stays_invisible(monkeypatch):
+    AppKit.NSApplication.sharedApplication()
+    now = [1000.0]
+    monkeypatch.setattr(overlay.time, "time", lambda: now[0])
+
+    controller = overlay.OverlayController(Settings())
+    for _ in range(60):
+        controller.update_gaze(0.0, 0.0, False, 0.0)
+        now[0] += 0.1
+
+    assert controller._current_opacity == pytest.approx(0.0, abs=0.01)
+    assert controller.view._crosshair_layer.opacity() == 0.0
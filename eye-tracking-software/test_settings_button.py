@@ -7,6 +7,8 @@ Uses performClick_ (no Accessibility permissions needed).
 Check /tmp/test_btn.log for results.
 """
 
+import atexit
+
 import objc
 import AppKit
 from Foundation import NSObject, NSMakeRect, NSTimer
@@ -18,9 +20,13 @@ from AppKit import (
 
 LOG_PATH = "/tmp/test_btn.log"
 
+# Opened (and truncated) once per run; buffered writes, flushed per test step
+_LOG_FH = open(LOG_PATH, "w", buffering=64 * 1024)
+atexit.register(_LOG_FH.close)
+
 def log(msg):
-    with open(LOG_PATH, "a") as f:
-        f.write(msg + "\n")
+    _LOG_FH.write(msg)
+    _LOG_FH.write("\n")
 
 
 class KeyableWindow(NSWindow):
@@ -86,23 +92,30 @@ class AppDel(NSObject):
         return self
 
     def applicationDidFinishLaunching_(self, notification):
-        with open(LOG_PATH, "w") as f:
-            f.write("=== performClick_ test ===\n")
+        log("=== performClick_ test ===")
 
         self.a = ButtonTester("A: Standard NSWindow (borderless)", NSWindow, 300)
         self.b = ButtonTester("B: KeyableWindow (borderless)", KeyableWindow, 150)
 
         log(f"A canBecomeKey={self.a.window.canBecomeKeyWindow()}")
         log(f"B canBecomeKey={self.b.window.canBecomeKeyWindow()}")
+        _LOG_FH.flush()
 
-        # Programmatic click after 1s
-        NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-            1.0, self, "doTest:", None, False
-        )
+        # One 1s timer drives the run: programmatic click at 1s, quit at 3s
+        self._step = 0
         NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-            3.0, self, "doQuit:", None, False
+            1.0, self, "tick:", None, True
         )
 
+    @objc.typedSelector(b"v@:@")
+    def tick_(self, timer):
+        self._step += 1
+        if self._step == 1:
+            self.doTest_(timer)
+        elif self._step == 3:
+            timer.invalidate()
+            self.doQuit_(timer)
+
     @objc.typedSelector(b"v@:@")
     def doTest_(self, timer):
         log("\n--- performClick_ on both buttons ---")
@@ -117,11 +130,18 @@ class AppDel(NSObject):
             log("RESULT: Only KeyableWindow works")
         else:
             log(f"RESULT: unexpected — A={self.a.fired}, B={self.b.fired}")
+        _LOG_FH.flush()
 
     @objc.typedSelector(b"v@:@")
     def doQuit_(self, timer):
+        # Drop the testers so their windows and views are released before exit
+        self.a = None
+        self.b = None
         NSApplication.sharedApplication().terminate_(None)
 
+    def applicationShouldTerminateAfterLastWindowClosed_(self, sender):
+        return True
+
 
 def main():
     app = NSApplication.sharedApplication()
@@ -1,18 +1,21 @@
 """Webcam preview window with MediaPipe landmark overlays."""
 
+import queue
+import threading
+
 import cv2
 import numpy as np
-import objc
 import AppKit
-from Foundation import NSObject, NSMakeRect
+import Quartz
+from Foundation import NSMakeRect
+from PyObjCTools import AppHelper
 from AppKit import (
-    NSWindow, NSView, NSColor, NSFont, NSImage, NSScreen,
+    NSWindow, NSView,
     NSWindowStyleMaskTitled, NSWindowStyleMaskClosable, NSWindowStyleMaskMiniaturizable,
-    NSBackingStoreBuffered, NSImageView, NSBitmapImageRep,
-    NSCompositingOperationSourceOver, NSScaleProportionally,
-    NSImageScaleProportionallyUpOrDown,
+    NSBackingStoreBuffered,
 )
-import mediapipe as mp
+
+from display_link import DisplayLink
 
 # Key landmark indices for visualization
 LEFT_EYE_CONTOUR = [33, 7, 163, 144, 145, 153, 154, 155, 133, 173, 157, 158, 159, 160, 161, 246]
@@ -23,18 +26,53 @@ FACE_OUTLINE = [10, 338, 297, 332, 284, 251, 389, 356, 454, 323, 361, 288, 397,
                 400, 377, 152, 148, 176, 149, 150, 136, 172, 58, 132, 93, 234, 127, 162, 21,
                 54, 103, 67, 109]
 
+# Only these landmarks are drawn, so only these are converted per frame:
+# _DRAWN_IDS lists them once each, and the _*_IDX arrays index into it
+_DRAWN_IDS = tuple(FACE_OUTLINE + LEFT_EYE_CONTOUR + RIGHT_EYE_CONTOUR + LEFT_IRIS + RIGHT_IRIS)
+_FACE_OUTLINE_IDX = np.arange(len(FACE_OUTLINE), dtype=np.int32)
+_EYE_CONTOUR_IDX = (
+    len(FACE_OUTLINE) + np.arange(2 * len(LEFT_EYE_CONTOUR), dtype=np.int32)
+).reshape(2, -1)
+_IRIS_IDX = (
+    len(FACE_OUTLINE) + 2 * len(LEFT_EYE_CONTOUR)
+    + np.arange(2 * len(LEFT_IRIS), dtype=np.int32)
+).reshape(2, -1)
+
 PREVIEW_WIDTH = 320
 PREVIEW_HEIGHT = 240
 
 
 class WebcamPreviewController:
-    """Manages the webcam preview window."""
+    """Manages the webcam preview window.
+
+    update_frame only hands the frame over; a render thread downscales it,
+    draws the landmarks and converts it into a CGImage, and a display link
+    puts the newest image on screen once per refresh.  The link is started
+    by each rendered frame and stops on the first refresh with nothing new.  Bursts of frames
+    collapse into the latest, and the caller never waits on the render.
+    """
 
     def __init__(self, settings, on_position_changed=None):
         self.settings = settings
         self.on_position_changed = on_position_changed
+        # False while the window is hidden or fully covered; frames are
+        # dropped without any conversion or drawing
+        self._visible = False
         self._setup_window()
 
+        # Newest (frame, landmarks) waiting to be rendered
+        self._frames = queue.Queue(maxsize=1)
+        # Newest rendered (slot, CGImage) waiting to be shown, and the slot
+        # on screen; neither buffer may be rendered into
+        self._image_lock = threading.Lock()
+        self._latest_image = None
+        self._shown_slot = None
+        self._display_link = DisplayLink(self._show_latest_image)
+        self._render_thread = threading.Thread(
+            target=self._render_loop, name="PreviewRender", daemon=True
+        )
+        self._render_thread.start()
+
     def _setup_window(self):
         x = self.settings.webcam_preview_x
         y = self.settings.webcam_preview_y
@@ -49,88 +87,152 @@ class WebcamPreviewController:
         self.window.setTitle_("Webcam Preview")
         self.window.setReleasedWhenClosed_(False)
 
-        self._image_view = NSImageView.alloc().initWithFrame_(
+        # Frames are shown as the contents of a layer-backed view
+        self._image_view = NSView.alloc().initWithFrame_(
             NSMakeRect(0, 0, PREVIEW_WIDTH, PREVIEW_HEIGHT)
         )
-        self._image_view.setImageScaling_(NSImageScaleProportionallyUpOrDown)
+        self._image_view.setWantsLayer_(True)
+        self._image_view.layer().setContentsGravity_(Quartz.kCAGravityResizeAspect)
         self.window.setContentView_(self._image_view)
 
+        self._resized = np.empty((PREVIEW_HEIGHT, PREVIEW_WIDTH, 3), dtype=np.uint8)
+        # Device RGB: exact colorimetry doesn't matter for a camera preview,
+        # and it spares a colour-matching pass on composite
+        self._color_space = Quartz.CGColorSpaceCreateDeviceRGB()
+        # RGB pixel buffers wrapped once in data providers, so each CGImage
+        # reads straight from numpy memory without a per-frame copy.  Three
+        # slots: one on screen, one waiting to be shown, one being rendered.
+        self._rgb_bufs = [
+            np.empty((PREVIEW_HEIGHT, PREVIEW_WIDTH, 3), dtype=np.uint8)
+            for _ in range(3)
+        ]
+        self._providers = [
+            Quartz.CGDataProviderCreateWithData(None, buf, buf.nbytes, None)
+            for buf in self._rgb_bufs
+        ]
+
+        self._occlusion_observer = AppKit.NSNotificationCenter.defaultCenter().addObserverForName_object_queue_usingBlock_(
+            AppKit.NSWindowDidChangeOcclusionStateNotification, self.window, None,
+            self._occlusion_changed,
+        )
+
+    def _occlusion_changed(self, notification):
+        self._visible = bool(self.window.occlusionState() & AppKit.NSWindowOcclusionStateVisible)
+        if not self._visible:
+            self._stop_display_link()
+
     def show(self):
         self.window.makeKeyAndOrderFront_(None)
+        self._visible = True
 
     def hide(self):
         self.window.orderOut_(None)
+        self._visible = False
+        self._stop_display_link()
+
+    def _stop_display_link(self):
+        # Under the image lock, so it can't interleave with the render
+        # thread publishing a frame and starting the link
+        with self._image_lock:
+            self._display_link.stop()
 
     def is_visible(self):
         return self.window.isVisible()
 
     def update_frame(self, frame, face_landmarks=None):
-        """Update the preview with a new frame and optional landmark overlay.
+        """Queue a new frame, with optional landmark overlay, for the preview.
+
+        Returns at once; the frame is rendered on the preview's own thread
+        and must not be modified afterwards.
 
         Args:
             frame: BGR numpy array from webcam
             face_landmarks: MediaPipe face landmarks (or None)
         """
-        display = frame.copy()
-        h, w = display.shape[:2]
-
+        if not self._visible:
+            return
+        try:
+            self._frames.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self._frames.put_nowait((frame, face_landmarks))
+        except queue.Full:
+            pass
+
+    def _render_loop(self):
+        while True:
+            frame, face_landmarks = self._frames.get()
+            with self._image_lock:
+                busy = {self._shown_slot}
+                if self._latest_image is not None:
+                    busy.add(self._latest_image[0])
+            slot = next(i for i in range(len(self._rgb_bufs)) if i not in busy)
+            image = self._render(frame, face_landmarks, slot)
+            if image is None:
+                continue
+            with self._image_lock:
+                self._latest_image = (slot, image)
+                if not self._visible:
+                    continue
+                started = self._display_link.start()
+            if not started:
+                AppHelper.callAfter(self._show_latest_image)
+
+    def _render(self, frame, face_landmarks, slot):
+        """Downscale, draw and convert frame into slot; returns a CGImage or None."""
+        # Downscale first, then draw on the preview-sized copy: landmarks
+        # are normalised, so preview dims scale them directly, and the copy
+        # is our own so the shared frame is never written to
+        cv2.resize(frame, (PREVIEW_WIDTH, PREVIEW_HEIGHT), dst=self._resized)
         if face_landmarks is not None:
-            self._draw_landmarks(display, face_landmarks, w, h)
-
-        # Resize
-        display = cv2.resize(display, (PREVIEW_WIDTH, PREVIEW_HEIGHT))
-
-        # Convert BGR to RGB
-        rgb = cv2.cvtColor(display, cv2.COLOR_BGR2RGB)
-        rh, rw, rc = rgb.shape
-        bytes_per_row = rc * rw
-
-        bitmap = NSBitmapImageRep.alloc().initWithBitmapDataPlanes_pixelsWide_pixelsHigh_bitsPerSample_samplesPerPixel_hasAlpha_isPlanar_colorSpaceName_bytesPerRow_bitsPerPixel_(
-            (rgb.tobytes(), None, None, None, None),
-            rw, rh, 8, 3, False, False, AppKit.NSCalibratedRGBColorSpace, bytes_per_row, 24
+            self._draw_landmarks(self._resized, face_landmarks, PREVIEW_WIDTH, PREVIEW_HEIGHT)
+
+        # Convert BGR to RGB in the slot's buffer and wrap it as a CGImage
+        cv2.cvtColor(self._resized, cv2.COLOR_BGR2RGB, dst=self._rgb_bufs[slot])
+        return Quartz.CGImageCreate(
+            PREVIEW_WIDTH, PREVIEW_HEIGHT, 8, 24, PREVIEW_WIDTH * 3,
+            self._color_space,
+            Quartz.kCGBitmapByteOrderDefault | Quartz.kCGImageAlphaNone,
+            self._providers[slot], None, False, Quartz.kCGRenderingIntentDefault,
         )
-        if bitmap:
-            image = NSImage.alloc().initWithSize_((rw, rh))
-            image.addRepresentation_(bitmap)
-            self._image_view.setImage_(image)
+
+    def _show_latest_image(self):
+        """Put the newest rendered image on screen (main thread)."""
+        with self._image_lock:
+            if self._latest_image is None:
+                # Nothing new since the last refresh; the next frame restarts it
+                self._display_link.stop()
+                return
+            self._shown_slot, image = self._latest_image
+            self._latest_image = None
+        Quartz.CATransaction.begin()
+        Quartz.CATransaction.setDisableActions_(True)
+        self._image_view.layer().setContents_(image)
+        Quartz.CATransaction.commit()
 
     def _draw_landmarks(self, frame, face, w, h):
         """Draw eye contours, iris, and face outline on frame."""
-        def get_pt(idx):
-            lm = face[idx]
-            return (int(lm.x * w), int(lm.y * h))
+        # The drawn landmarks as one (N, 2) array of integer pixel coordinates
+        xy = np.fromiter(
+            (c for i in _DRAWN_IDS for c in (face[i].x, face[i].y)),
+            dtype=np.float32, count=len(_DRAWN_IDS) * 2,
+        ).reshape(-1, 2)
+        pts = (xy * np.array([w, h], dtype=np.float32)).astype(np.int32)
 
         # Face outline
-        pts = [get_pt(i) for i in FACE_OUTLINE]
-        for i in range(len(pts) - 1):
-            cv2.line(frame, pts[i], pts[i + 1], (100, 100, 100), 1)
-        cv2.line(frame, pts[-1], pts[0], (100, 100, 100), 1)
-
-        # Left eye contour
-        pts = [get_pt(i) for i in LEFT_EYE_CONTOUR]
-        for i in range(len(pts) - 1):
-            cv2.line(frame, pts[i], pts[i + 1], (0, 255, 0), 1)
-        cv2.line(frame, pts[-1], pts[0], (0, 255, 0), 1)
-
-        # Right eye contour
-        pts = [get_pt(i) for i in RIGHT_EYE_CONTOUR]
-        for i in range(len(pts) - 1):
-            cv2.line(frame, pts[i], pts[i + 1], (0, 255, 0), 1)
-        cv2.line(frame, pts[-1], pts[0], (0, 255, 0), 1)
-
-        # Left iris
-        center = get_pt(LEFT_IRIS[0])
-        for idx in LEFT_IRIS[1:]:
-            pt = get_pt(idx)
-            cv2.line(frame, center, pt, (0, 200, 255), 1)
-        cv2.circle(frame, center, 3, (0, 200, 255), -1)
-
-        # Right iris
-        center = get_pt(RIGHT_IRIS[0])
-        for idx in RIGHT_IRIS[1:]:
-            pt = get_pt(idx)
-            cv2.line(frame, center, pt, (0, 200, 255), 1)
-        cv2.circle(frame, center, 3, (0, 200, 255), -1)
+        cv2.polylines(frame, [pts[_FACE_OUTLINE_IDX]], True, (100, 100, 100), 1)
+
+        # Eye contours
+        cv2.polylines(frame, list(pts[_EYE_CONTOUR_IDX]), True, (0, 255, 0), 1)
+
+        # Irises: spokes from each centre to its four edge points, then a dot
+        iris = pts[_IRIS_IDX]               # (2 eyes, 5 points, 2)
+        centers = iris[:, :1]               # (2, 1, 2)
+        spokes = np.stack(np.broadcast_arrays(centers, iris[:, 1:]), axis=2)
+        cv2.polylines(frame, list(spokes.reshape(-1, 2, 2)), False, (0, 200, 255), 1)
+        for cx, cy in centers[:, 0]:
+            cv2.circle(frame, (int(cx), int(cy)), 3, (0, 200, 255), -1)
 
     def save_position(self):
         """Save current window position to settings."""